@@ -0,0 +1,188 @@
+"""
+Both answers of day 01 for location lists of any length, in O(n log n).
+
+The lists are sorted in place and then walked in chunks, so on top of the two int64 arrays themselves
+(800 MB each for 100M rows) only a few chunk sized temporaries are ever allocated.
+"""
+import mmap
+import tempfile
+from pathlib import Path
+from typing import Iterator
+from aoc import lazy
+
+np = lazy.module("numpy")
+
+CHUNK = 1 << 20 # rows handled at once, i.e. the temporaries are a few times 8 MiB
+READ_CHUNK = 64 << 20 # bytes of a memory mapped input parsed at once, also the size of a run of the external sort
+MERGE_BUFFER = 1 << 22 # values of all runs held at once while merging them
+
+def _parse(text: bytes) -> 'np.ndarray':
+    # C speed, unlike read_csv with a regex separator; sep=' ' matches any whitespace, newlines included
+    return np.fromstring(text, dtype=np.int64, sep=' ')
+
+def _pieces(buffer: mmap.mmap, size: int) -> Iterator['np.ndarray']:
+    """Parses the buffer in pieces of about `size` bytes, cut after a newline so no line is split."""
+    start = 0
+    while start < len(buffer):
+        end = buffer.find(b'\n', start + size) + 1 or len(buffer)
+        yield _parse(buffer[start:end])
+        start = end
+
+def _columns(values: 'np.ndarray', input_file: str) -> tuple['np.ndarray', 'np.ndarray']:
+    if len(values) % 2:
+        raise ValueError(f"{input_file} is not two columns of integers")
+    values = values.reshape(-1, 2)
+    return values[:, 0].copy(), values[:, 1].copy() # contiguous, to be sorted in place
+
+def load_lists(input_file: str, use_mmap: bool = False) -> tuple['np.ndarray', 'np.ndarray']:
+    """
+    Reads the two columns of location IDs straight into int64 arrays.
+
+    Args:
+        use_mmap: Parse the memory mapped file piece by piece instead of reading all of it first,
+            for inputs of several GB.
+    """
+    with open(input_file, 'rb') as file:
+        if not use_mmap:
+            values = _parse(file.read())
+        elif Path(input_file).stat().st_size == 0:
+            values = np.empty(0, dtype=np.int64) # can't map an empty file
+        else:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                parts = list(_pieces(buffer, READ_CHUNK))
+                values = np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+    return _columns(values, input_file)
+
+def sort_lists(left: 'np.ndarray', right: 'np.ndarray'):
+    """Sorts both lists in place, without the copies sort_values()/np.sort() would make."""
+    left.sort()
+    right.sort()
+
+def total_distance(left: 'np.ndarray', right: 'np.ndarray', chunk: int = CHUNK) -> int:
+    """Sum of |a-b| over the pairs of the sorted lists."""
+    total = 0
+    for i in range(0, len(left), chunk):
+        total += int(np.abs(left[i:i+chunk] - right[i:i+chunk]).sum())
+    return total
+
+def occurrences(right: 'np.ndarray', values: 'np.ndarray') -> 'np.ndarray':
+    """How often each of the values appears in the sorted right list."""
+    return np.searchsorted(right, values, side='right') - np.searchsorted(right, values, side='left')
+
+def similarity_score(left: 'np.ndarray', right: 'np.ndarray', chunk: int = CHUNK) -> int:
+    """
+    Sum of each left location times how often it appears in the right list.
+
+    Args:
+        left: In any order.
+        right: Sorted.
+    """
+    total = 0
+    for i in range(0, len(left), chunk):
+        # join the distinct values of the chunk with their counts on the right, rather than row by row
+        values, counts = np.unique(left[i:i+chunk], return_counts=True)
+        total += int((values * counts * occurrences(right, values)).sum())
+    return total
+
+# External sort, for lists which don't fit in memory
+
+def sorted_runs(input_file: str, directory: Path, run_bytes: int = READ_CHUNK) -> tuple[list[Path], list[Path]]:
+    """Sorts each piece of about `run_bytes` of the input and saves its two columns, returns the files of each."""
+    runs = ([], [])
+    if Path(input_file).stat().st_size == 0:
+        return runs # can't map an empty file
+    with open(input_file, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        for i, values in enumerate(_pieces(buffer, run_bytes)):
+            for column, paths, name in zip(_columns(values, input_file), runs, ("left", "right")):
+                column.sort()
+                paths.append(directory / f"{name}{i}.npy")
+                np.save(paths[-1], column)
+    return runs
+
+def merge_runs(paths: list[Path], buffer: int = MERGE_BUFFER) -> Iterator['np.ndarray']:
+    """
+    K-way merge of the sorted runs, read through memory maps.
+
+    Yields:
+        np.ndarray: blocks of the merged values, in order.
+    """
+    runs = [np.load(path, mmap_mode='r') for path in paths]
+    block = max(1024, buffer // max(1, len(runs)))
+    positions = [0] * len(runs)
+    pending = [np.empty(0, dtype=np.int64) for _ in runs] # read, but not merged yet
+    while True:
+        for i, run in enumerate(runs):
+            if len(pending[i]) < block and positions[i] < len(run):
+                pending[i] = np.concatenate((pending[i], run[positions[i]:positions[i] + block]))
+                positions[i] += block
+        if not any(len(values) for values in pending):
+            return
+        # nothing still unread can be smaller than the last value read of a run which isn't exhausted
+        bounds = [pending[i][-1] for i, run in enumerate(runs) if positions[i] < len(run)]
+        merged = []
+        for i, values in enumerate(pending):
+            cut = np.searchsorted(values, min(bounds), side='right') if bounds else len(values)
+            merged.append(values[:cut])
+            pending[i] = values[cut:]
+        yield np.sort(np.concatenate(merged))
+
+def _blocks(stream: Iterator['np.ndarray'], size: int) -> Iterator['np.ndarray']:
+    """The same values in blocks of exactly `size` (but the last), to walk two streams in lockstep."""
+    rest = np.empty(0, dtype=np.int64)
+    for values in stream:
+        rest = np.concatenate((rest, values))
+        while len(rest) >= size:
+            yield rest[:size]
+            rest = rest[size:]
+    if len(rest):
+        yield rest
+
+def _counts(stream: Iterator['np.ndarray']) -> Iterator[tuple['np.ndarray', 'np.ndarray']]:
+    """Distinct values of a sorted stream with how often they appear, a value never spans two blocks."""
+    carry = None
+    for block in stream:
+        values, counts = np.unique(block, return_counts=True)
+        if carry is not None:
+            if values[0] == carry[0]:
+                counts[0] += carry[1]
+            else:
+                values, counts = np.insert(values, 0, carry[0]), np.insert(counts, 0, carry[1])
+        carry = values[-1], counts[-1]
+        if len(values) > 1:
+            yield values[:-1], counts[:-1]
+    if carry is not None:
+        yield np.array([carry[0]]), np.array([carry[1]])
+
+def _similarity(left: Iterator['np.ndarray'], right: Iterator['np.ndarray']) -> int:
+    """Similarity score of the merged lists, joining the counts of both."""
+    right = _counts(right)
+    right_values = right_counts = np.empty(0, dtype=np.int64)
+    total = 0
+    for values, counts in _counts(left):
+        # read the right counts up to the largest left value of the block
+        while not len(right_values) or right_values[-1] < values[-1]:
+            more = next(right, None)
+            if more is None:
+                break
+            right_values = np.concatenate((right_values, more[0]))
+            right_counts = np.concatenate((right_counts, more[1]))
+        if len(right_values):
+            found = np.searchsorted(right_values, values).clip(max=len(right_values) - 1)
+            matches = right_values[found] == values
+            total += int((values[matches] * counts[matches] * right_counts[found[matches]]).sum())
+        done = np.searchsorted(right_values, values[-1], side='right')
+        right_values, right_counts = right_values[done:], right_counts[done:]
+    return total
+
+def external_totals(input_file: str, run_bytes: int = READ_CHUNK, directory: str | None = None) -> tuple[int, int]:
+    """
+    Total distance and similarity score of lists too large for memory: the input is sorted in runs
+    of `run_bytes` saved to temporary files (in `directory`, default: the system's), which are
+    then merged, both lists in lockstep.
+    """
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        left, right = sorted_runs(input_file, Path(tmp), run_bytes)
+        distance = 0
+        for a, b in zip(_blocks(merge_runs(left), CHUNK), _blocks(merge_runs(right), CHUNK)):
+            distance += int(np.abs(a - b).sum())
+        return distance, _similarity(merge_runs(left), merge_runs(right))
@@ -1,30 +1,28 @@
+import puzzle
+import location_lists
 
-# %%
-import pandas as pd
+quest = puzzle.load_puzzle('input.txt')
+quest.do()
+actual = quest.checksum()
+print("Quest Checksum:", actual)
 
-df = pd.read_csv('input.txt', sep=r'\s{3}', engine='python', header=None, names=['List1', 'List2'])
+expected = 2769675
+assert expected==actual, f"Part 1 failed!\n  Expected: {expected}\n  Actual: {actual}"
 
-# %%
-# sort each
-df['List1'] = df['List1'].sort_values().values
-df['List2'] = df['List2'].sort_values().values
+# plausability check
+counts = location_lists.occurrences(quest.right, quest.left)
+print(quest.left[counts > 1], counts[counts > 1])
 
-# %%
-# calc diff
-df['Delta'] = (df['List1'] - df['List2']).abs()
-total_distance = df['Delta'].sum()
+p2 = quest.check_p2()
+print("Quest Checksum Part 2:", p2)
 
-print(total_distance) #2769675
-# %%
-# Part 2
-df['CountInList2'] = df['List1'].apply(lambda x: (df['List2'] == x).sum())
-df['SimilarityScore'] = df['List1'] * df['CountInList2']
+expected = 24643097
+assert expected==p2, f"Part 2 failed!\n  Expected: {expected}\n  Actual: {p2}"
 
-# %%
-plausability_check_df = df[df['CountInList2'] > 1]
-print(plausability_check_df)
+# the memory mapped loader reads the same lists
+left, right = location_lists.load_lists('input.txt', use_mmap=True)
+location_lists.sort_lists(left, right)
+assert (left == quest.left).all() and (right == quest.right).all()
 
-# %%
-total_similarity_score = df['SimilarityScore'].sum()
-print(total_similarity_score) #24643097
-# %%
+# and the external sort gets the same totals, from runs of about 100 lines
+assert location_lists.external_totals('input.txt', run_bytes=1400) == (actual, p2)
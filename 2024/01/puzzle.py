@@ -0,0 +1,33 @@
+import location_lists
+from aoc import lazy
+
+np = lazy.module("numpy")
+
+class Puzzle:
+    def __init__(self, left: 'np.ndarray', right: 'np.ndarray'):
+        self.left = left
+        self.right = right
+        self.distance = None
+        self.similarity = None
+
+    def do(self):
+        # sort each
+        location_lists.sort_lists(self.left, self.right)
+
+        # calc diff
+        self.distance = location_lists.total_distance(self.left, self.right)
+
+        # Part 2, looked up in the sorted right list instead of scanning it for every row
+        self.similarity = location_lists.similarity_score(self.left, self.right)
+
+    def checksum(self):
+        """Total distance between the sorted lists."""
+        return self.distance
+
+    def check_p2(self):
+        """Total similarity score."""
+        return self.similarity
+
+def load_puzzle(input_file: str, use_mmap: bool = False) -> Puzzle:
+    """Load Puzzle from input file (path)."""
+    return Puzzle(*location_lists.load_lists(input_file, use_mmap))
@@ -0,0 +1,249 @@
+from collections import deque
+from dataclasses import dataclass
+from itertools import chain, islice
+from typing import Iterator
+from aoc import lazy
+
+np = lazy.module("numpy")
+
+CHUNK_SIZE = 10_000 # reports classified per task when streaming
+
+def check_safety(report: list[int], skip=-1) -> int:
+    """
+    Checks safety of a report.
+
+    Args:
+        report (list[int]): The levels in a report.
+        skip: Index of a level in the report to be skipped.
+
+    Returns:
+        int: The index of the first level that was unsafe. Or -1 if safe.
+    """
+    const_dir = True
+    valid_dif = True
+
+    last_level: int = None
+    last_cmp: int = None
+    for index, level in enumerate(report):
+        if index == skip: continue
+        if last_level is None: 
+            last_level = level
+            continue
+
+        cmp = (last_level > level) - (last_level < level)
+        if last_cmp is not None:
+            const_dir = const_dir and cmp != 0 and cmp == last_cmp
+
+        dif = abs(last_level - level)
+        valid_dif = valid_dif and (1 <= dif <=3)
+
+        if not (const_dir and valid_dif):
+            return index
+        
+        last_cmp = cmp
+        last_level = level
+
+    return -1
+
+def pack_reports(reports: list[list[int]]) -> tuple['np.ndarray', 'np.ndarray']:
+    """
+    Packs the ragged reports into one array, padded to the longest.
+
+    Returns:
+        np.ndarray: The levels, one report per row.
+        np.ndarray: The number of levels of each report.
+    """
+    lengths = np.fromiter(map(len, reports), dtype=np.int64, count=len(reports))
+    levels = np.zeros((len(reports), lengths.max(initial=0)), dtype=np.int64)
+    levels[np.arange(levels.shape[1]) < lengths[:, None]] = np.fromiter(chain.from_iterable(reports), dtype=np.int64, count=lengths.sum())
+    return levels, lengths
+
+def safe_reports(levels: 'np.ndarray', lengths: 'np.ndarray') -> 'np.ndarray':
+    """
+    Checks safety of all reports at once, same as check_safety(report) < 0 for each.
+
+    Args:
+        levels, lengths: The packed reports, see pack_reports.
+
+    Returns:
+        np.ndarray: Whether each report is safe.
+    """
+    difs = np.diff(levels, axis=1)
+    padding = np.arange(difs.shape[1]) >= lengths[:, None] - 1 # the difs beyond the end of a report don't count
+    increasing = ((1 <= difs) & (difs <= 3)) | padding
+    decreasing = ((-3 <= difs) & (difs <= -1)) | padding
+    return increasing.all(axis=1) | decreasing.all(axis=1)
+
+def _chain_valid(report: list[int], direction: int) -> tuple[list[bool], list[bool]]:
+    """
+    Returns:
+        list[bool]: For each index, whether the levels up to it are a safe report in the direction (+1 or -1).
+        list[bool]: For each index, whether the levels from it on are.
+    """
+    n = len(report)
+    step_ok = [1 <= direction * (report[i+1] - report[i]) <= 3 for i in range(n - 1)]
+    prefix = [True] * n
+    suffix = [True] * n
+    for i in range(1, n):
+        prefix[i] = prefix[i-1] and step_ok[i-1]
+    for i in range(n - 2, -1, -1):
+        suffix[i] = suffix[i+1] and step_ok[i]
+    return prefix, suffix
+
+def problem_dampener(report: list[int]) -> bool:
+    """
+    The Problem Dampener is a reactor-mounted module that lets the reactor safety systems tolerate a single bad level in what would otherwise be a safe report. It's like the bad level never happened!
+
+    Instead of retrying check_safety without each level, this knows for each level whether the levels
+    before and after it are safe, so skipping level j works if both sides do and its neighbours fit together.
+    O(k) per report, same result as brute_force_dampener.
+
+    Args:
+        report (list[int]): The levels in a report.
+
+    Return:
+        bool: True if Safe
+    """
+    n = len(report)
+    if n <= 2: return True
+    for direction in (1, -1):
+        prefix, suffix = _chain_valid(report, direction)
+        if prefix[-1]: return True
+        for j in range(n):
+            if j > 0 and not prefix[j-1]: break # nor for any later j
+            if j < n - 1 and not suffix[j+1]: continue
+            if 0 < j < n - 1 and not 1 <= direction * (report[j+1] - report[j-1]) <= 3: continue
+            return True
+    return False
+
+def brute_force_dampener(report: list[int]) -> bool:
+    """
+    The Problem Dampener by retrying check_safety without each level, O(k²) per report.
+    The reference to check problem_dampener against.
+
+    Args:
+        report (list[int]): The levels in a report.
+
+    Return:
+        bool: True if Safe
+    """
+    failed_level = check_safety(report)
+    if failed_level < 0: return True
+
+    #the only way to fix a failed level should be by either removing that level itself or any adjacents... nvm, let's try brute force
+    for lvl in range(len(report)):
+        failed_level = check_safety(report, lvl)
+        if failed_level < 0: return True
+    return False
+
+def almost_problem_dampener(report: list[int]) -> bool:
+    """
+    My first attempt of the Problem Dampener.
+
+    Args:
+        report (list[int]): The levels in a report.
+
+    Return:
+        bool: True if Safe
+    """
+    failed_level = check_safety(report)
+    if failed_level < 0: return True
+
+    #the only way to fix a failed level should be by either removing that level itself or any adjacents...
+    for lvl in range(failed_level-1, failed_level+1):
+        failed_level = check_safety(report, lvl)
+        if failed_level < 0: return True
+    return False
+
+@dataclass
+class Tally:
+    """Safe reports, without (Part 1) and with the Problem Dampener (Part 2)."""
+    n_safe: int = 0
+    n_dampened: int = 0
+    safe: list[list[int]] | None = None # with the Problem Dampener, only if asked for
+    unsafe: list[list[int]] | None = None
+
+    def add(self, other: 'Tally'):
+        self.n_safe += other.n_safe
+        self.n_dampened += other.n_dampened
+        if other.safe is not None:
+            if self.safe is None:
+                self.safe, self.unsafe = [], []
+            self.safe.extend(other.safe)
+            self.unsafe.extend(other.unsafe)
+
+def parse_report(line: str) -> list[int] | None:
+    """The levels of a report, None for a blank line (which is no report, wherever it is read)."""
+    return None if line.isspace() else list(map(int, line.split()))
+
+def classify(lines: list[str], keep_lists: bool = False) -> Tally:
+    """Parses and classifies a chunk of reports, one per line."""
+    reports = [report for report in map(parse_report, lines) if report is not None]
+    tally = Tally(n_safe=int(safe_reports(*pack_reports(reports)).sum()))
+    if keep_lists:
+        tally.safe, tally.unsafe = [], []
+    for report in reports:
+        dampened = problem_dampener(report)
+        tally.n_dampened += dampened
+        if keep_lists:
+            (tally.safe if dampened else tally.unsafe).append(report)
+    return tally
+
+def _chunks(input_file: str, size: int) -> Iterator[list[str]]:
+    with open(input_file, "r") as file:
+        while lines := list(islice(file, size)):
+            yield lines
+
+def stream_reports(input_file: str, chunk_size: int = CHUNK_SIZE, keep_lists: bool = False) -> Tally:
+    """
+    Classifies the reports of a file of any size in chunks on the shared worker pool. Only a few
+    chunks are read ahead, so unless the lists are kept the memory does not grow with the file.
+
+    Args:
+        keep_lists: Also collect the safe and unsafe reports, in the order of the file.
+    """
+    from aoc import workers
+    total = Tally()
+    pending = deque()
+    for lines in _chunks(input_file, chunk_size):
+        pending.append(workers.submit(classify, lines, keep_lists))
+        if len(pending) >= 2 * workers.size():
+            total.add(pending.popleft().result())
+    while pending:
+        total.add(pending.popleft().result())
+    return total
+
+class Puzzle:
+    def __init__(self, reports: list[list[int]]):
+        self.reports = {
+            "toproc": reports,
+            "unsafe": [],
+            "safe": []
+        }
+        self.levels, self.lengths = pack_reports(reports)
+        self.n_safe = 0 # without the Problem Dampener
+
+    def do(self):
+        self.n_safe = int(safe_reports(self.levels, self.lengths).sum())
+
+        for report in self.reports["toproc"]:
+            if problem_dampener(report):
+                self.reports["safe"].append(report)
+            else:
+                self.reports["unsafe"].append(report)
+
+    def checksum(self) -> int:
+        return self.n_safe
+
+    def check_p2(self) -> int:
+        return len(self.reports["safe"])
+
+def load_puzzle(input_file: str) -> Puzzle:
+    """Load Puzzle from input file (path)."""
+    reports = []
+    with open(input_file, "r") as file:
+        for line in file:
+            levels = parse_report(line)
+            if levels is not None:
+                reports.append(levels)
+    return Puzzle(reports)
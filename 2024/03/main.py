@@ -1,32 +1,23 @@
-# %%
-import re
-
-with open("input.txt", "r") as file:
-    content = file.read()
-
-# mul(X,Y), where X and Y are each 1-3 digit numbers
-mul_pattern = r"mul\(\d{1,3},\d{1,3}\)"
-
-# everything between "do()" and "don't()"
-do_pattern = r"do\(\)(.*?)don't\(\)"
-
-# let's save us the edge case handling and round up the edges instead...
-does = re.findall(do_pattern, "do()"+content+"don't()", re.DOTALL) #DOTALL to handle newline
-
-matches = []
-for do in does:
-    matches.extend(re.findall(mul_pattern, do))
-
-print(does)
-print(matches)
-
-# %%
-results = []
-for match in matches:
-    x,y = map(int, match[4:-1].split(','))
-    results.append(x * y)
-total = sum(results)
-print(results) 
-print(total) #Part 1: 182'619'815  // Part 2: 61'054'530 (f) -> 63'518'894 (f) -> 65'949'847 (f) -> 80'747'545
-
-# %%
+import puzzle
+
+quest = puzzle.load_puzzle('input.txt')
+quest.do()
+print(quest.enabled_matches)
+
+actual = quest.checksum()
+print("Quest Checksum:", actual)
+expected = 182619815
+assert expected==actual, f"Part 1 failed!\n  Expected: {expected}\n  Actual: {actual}"
+
+p2 = quest.check_p2()
+print("Quest Checksum Part 2:", p2) # 61'054'530 (f) -> 63'518'894 (f) -> 65'949'847 (f) -> 80'747'545
+expected = 80747545
+assert expected==p2, f"Part 2 failed!\n  Expected: {expected}\n  Actual: {p2}"
+
+# the same without keeping any matches, straight from the memory mapped file (as the runner solves it)
+assert puzzle.scan_file('input.txt') == (actual, p2)
+scanned = puzzle.load_puzzle('input.txt')
+scanned.scan()
+assert (scanned.checksum(), scanned.check_p2()) == (actual, p2)
+# and in chunks on the worker pool, stitched together
+assert puzzle.scan_parallel('input.txt', chunk_size=97) == (actual, p2)
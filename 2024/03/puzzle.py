@@ -0,0 +1,160 @@
+import mmap
+import re
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+
+# mul(X,Y), where X and Y are each 1-3 digit numbers, do() and don't()
+instruction_pattern = r"mul\((\d{1,3}),(\d{1,3})\)|do\(\)|don't\(\)"
+instructions = re.compile(instruction_pattern)
+byte_instructions = re.compile(instruction_pattern.encode()) # to scan (memory mapped) bytes
+MAX_LENGTH = len("mul(999,999)") # of an instruction
+CHUNK_SIZE = 16 << 20 # bytes scanned per task by scan_parallel
+
+def scan(buffer: bytes | mmap.mmap, enabled: bool = True) -> tuple[int, int]:
+    """
+    Scans the corrupted memory once, keeping track of whether mul is enabled.
+
+    Args:
+        enabled: Whether mul is enabled at the start.
+
+    Returns:
+        int: Sum of all products.
+        int: Sum of the enabled products.
+    """
+    total = enabled_total = 0
+    for match in byte_instructions.finditer(buffer):
+        if match[1] is None:
+            enabled = match[0] == b"do()"
+            continue
+        product = int(match[1]) * int(match[2])
+        total += product
+        if enabled:
+            enabled_total += product
+    return total, enabled_total
+
+def scan_file(input_file: str) -> tuple[int, int]:
+    """Both sums of a corrupted memory dump of any size, scanned through a memory map (see scan)."""
+    if Path(input_file).stat().st_size == 0:
+        return 0, 0 # can't map an empty file
+    with open(input_file, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        return scan(buffer)
+
+@dataclass
+class ChunkSums:
+    """Scan of a byte range, which can't know yet whether mul is enabled at its start."""
+    total: int # of all products
+    if_enabled: int # of the enabled products, if mul is enabled at the start
+    if_disabled: int # ...if it is disabled
+    enabled_after: bool | None # as set by the last do() or don't(), None if there is none
+    head: bytes # the first and last few bytes, for instructions across the boundaries
+    tail: bytes
+
+def scan_range(input_file: str, size: int, start: int) -> ChunkSums:
+    """Scans the instructions within `size` bytes from `start` of the memory mapped file."""
+    with open(input_file, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        end = min(start + size, len(buffer))
+        total = undecided = decided = 0 # products before and after the first do() or don't()
+        enabled = None
+        for match in byte_instructions.finditer(buffer, start, end):
+            if match[1] is None:
+                enabled = match[0] == b"do()"
+                continue
+            product = int(match[1]) * int(match[2])
+            total += product
+            if enabled is None:
+                undecided += product
+            elif enabled:
+                decided += product
+        margin = MAX_LENGTH - 1
+        return ChunkSums(total, undecided + decided, decided, enabled,
+                       buffer[start:min(start + margin, end)], buffer[max(end - margin, start):end])
+
+def _across(tail: bytes, head: bytes) -> re.Match | None:
+    """The instruction which starts in the tail of one range and ends in the head of the next, if any."""
+    for match in byte_instructions.finditer(tail + head):
+        if match.start() < len(tail) < match.end():
+            return match
+    return None
+
+def scan_parallel(input_file: str, chunk_size: int = CHUNK_SIZE) -> tuple[int, int]:
+    """
+    Same as scan_file, but the file is split into chunks of `chunk_size` bytes scanned on the shared
+    worker pool. As a chunk doesn't know whether mul is enabled at its start, it sums the enabled
+    products for both cases, which are then picked in order, together with the instructions across
+    the boundaries of the chunks.
+    """
+    from aoc import workers
+    if chunk_size < MAX_LENGTH:
+        raise ValueError(f"chunks of {chunk_size} bytes might not even hold an instruction")
+    size = Path(input_file).stat().st_size
+    if size == 0:
+        return 0, 0
+    chunks = list(workers.map(partial(scan_range, input_file, chunk_size), range(0, size, chunk_size)))
+
+    total = enabled_total = 0
+    enabled = True
+    for i, part in enumerate(chunks):
+        total += part.total
+        enabled_total += part.if_enabled if enabled else part.if_disabled
+        if part.enabled_after is not None:
+            enabled = part.enabled_after
+        match = _across(part.tail, chunks[i+1].head) if i + 1 < len(chunks) else None
+        if match is None:
+            continue
+        if match[1] is None:
+            enabled = match[0] == b"do()"
+            continue
+        product = int(match[1]) * int(match[2])
+        total += product
+        if enabled:
+            enabled_total += product
+    return total, enabled_total
+
+class Puzzle:
+    def __init__(self, input_file: str):
+        self.input_file = input_file # scanned when solving, so parsing holds nothing but its path
+        self.matches: list[str] = []
+        self.enabled_matches: list[str] = []
+        self.total = 0
+        self.enabled_total = 0
+
+    def scan(self):
+        """Both sums in one pass over the memory mapped file, without keeping any matches (see scan_file)."""
+        self.total, self.enabled_total = scan_file(self.input_file)
+
+    def do(self):
+        """Same as scan, but keeps the (enabled) mul instructions too, to look at them."""
+        with open(self.input_file, "r") as file:
+            content = file.read()
+        # one pass, switching on and off, instead of cutting out the do() regions first
+        self.matches = []
+        self.enabled_matches = []
+        enabled = True
+        for match in instructions.finditer(content):
+            if match[1] is None:
+                enabled = match[0] == "do()"
+                continue
+            self.matches.append(match[0])
+            if enabled:
+                self.enabled_matches.append(match[0])
+        self.total = self.multiply(self.matches)
+        self.enabled_total = self.multiply(self.enabled_matches)
+
+    @staticmethod
+    def multiply(matches: list[str]) -> int:
+        results = []
+        for match in matches:
+            x,y = map(int, match[4:-1].split(','))
+            results.append(x * y)
+        return sum(results)
+
+    def checksum(self) -> int:
+        return self.total
+
+    def check_p2(self) -> int:
+        return self.enabled_total
+
+def load_puzzle(input_file: str) -> Puzzle:
+    """Load Puzzle from input file (path), which is only read once it is solved."""
+    return Puzzle(input_file)
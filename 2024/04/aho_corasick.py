@@ -0,0 +1,89 @@
+"""Aho–Corasick automaton, finds all occurrences of any number of words in one pass over a text."""
+from typing import Iterator
+
+from aoc import lazy
+
+np = lazy.module("numpy")
+
+CHUNK = 1 << 16 # states whose failure links are resolved at once, bounds the temporary copies of their rows
+
+class Automaton:
+    """
+    The trie of the words, with the failure links resolved into a full transition table,
+    so each character of a text costs one lookup, however many words there are.
+
+    The table has a column for each character the words use (and one for all others) and takes
+    4 bytes per column and state, so it holds a whole dictionary of words (some 1M states).
+    A word given more than once is reported under its first index.
+    """
+    def __init__(self, words: list[bytes]):
+        self.words = words
+        first: dict[bytes, int] = {}
+        for index, word in enumerate(words):
+            if word:
+                first.setdefault(word, index)
+        ordered = sorted(first)
+        used = sorted(set(b"".join(ordered)))
+        self.columns = np.zeros(256, dtype=np.uint32) # of each character, 0 for those no word uses
+        self.columns[used] = np.arange(1, len(used) + 1)
+        self.width = len(used) + 1
+
+        # sorted, each word shares the states of its prefix with the word before (their longest common prefix)
+        lengths = np.array([len(word) for word in ordered], dtype=np.intp)
+        indices = np.array([first[word] for word in ordered], dtype=np.uint32)
+        longest = int(lengths.max(initial=0))
+        chars = np.array(ordered, dtype=f"S{max(longest, 1)}").view(np.uint8).reshape(len(ordered), max(longest, 1))
+        differ = chars[1:] != chars[:-1]
+        shared = np.zeros(len(ordered), dtype=np.intp)
+        shared[1:] = np.minimum(np.where(differ.any(axis=1), differ.argmax(axis=1), longest), lengths[:-1])
+        del differ
+
+        # the trie, depth by depth, so the states of each depth are numbered one after another (breadth first)
+        states = 1 + int((lengths - shared).sum())
+        self.delta = np.zeros((states, self.width), dtype=np.uint32)
+        self.word_at = np.zeros(states, dtype=np.uint32) # index + 1 of the word ending in each state, 0 if none
+        rows = np.arange(len(ordered))
+        node = np.zeros(len(ordered), dtype=np.uint32) # the state each word reached so far
+        levels = [0, 1] # where the states of each depth start
+        for depth in range(longest):
+            new = (shared <= depth) & (lengths > depth)
+            count = int(new.sum())
+            reached = np.zeros(len(ordered), dtype=np.uint32)
+            reached[new] = np.arange(levels[-1], levels[-1] + count)
+            reached = reached[np.maximum.accumulate(np.where(new, rows, 0))] # the words sharing it, the state of the one before
+            self.delta[node[new], self.columns[chars[new, depth]]] = reached[new]
+            ends = lengths == depth + 1
+            self.word_at[reached[ends]] = indices[ends] + 1
+            node = reached
+            levels.append(levels[-1] + count)
+        del first, ordered, chars
+
+        # a level at a time, so the states the failure links point to (which are shallower) are done already
+        fail = np.zeros(states, dtype=np.uint32)
+        self.link = np.zeros(states, dtype=np.uint32) # the next state along the failure links in which a word ends
+        for start, stop in zip(levels, levels[1:]):
+            for chunk in range(start, stop, CHUNK):
+                parents = slice(chunk, min(chunk + CHUNK, stop))
+                rows = self.delta[parents]
+                children = rows != 0 # a child is never the root
+                failed = self.delta[fail[parents]] if start else np.zeros_like(rows) # the root's children fail to it
+                kids, targets = rows[children], failed[children]
+                fail[kids] = targets
+                self.link[kids] = np.where(self.word_at[targets] != 0, targets, self.link[targets])
+                np.copyto(rows, failed, where=~children)
+
+    def search(self, text: bytes) -> Iterator[tuple[int, int]]:
+        """
+        Yields:
+            tuple[int, int]: index of the last character of an occurrence and index of its word.
+        """
+        # indexing memoryviews gives plain ints, which is faster than numpy scalars
+        delta, word_at, link = (memoryview(array.reshape(-1)) for array in (self.delta, self.word_at, self.link))
+        columns, width = self.columns.tolist(), self.width
+        state = 0
+        for i, char in enumerate(text):
+            state = delta[state * width + columns[char]]
+            match = state if word_at[state] else link[state]
+            while match:
+                yield i, word_at[match] - 1
+                match = link[match]
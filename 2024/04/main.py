@@ -1,5 +1,4 @@
 import wordsearch as ws
-from tqdm import tqdm
 
 test = ws.load_puzzle('input/test.txt')
 expected = 18
@@ -18,4 +17,30 @@ expected = 9
 actual = test.count_x_mas()
 assert expected==actual, f"Test failed!\n  Expected: {expected}\n  Actual: {actual}"
 
-print(quest.count_x_mas()) # 1880 / <1907! (not + only X) / <2505! (not * only X)
\ No newline at end of file
+print(quest.count_x_mas()) # 1880 / <1907! (not + only X) / <2505! (not * only X)
+
+# all words in one pass, same counts as one by one
+words = ["XMAS", "SAMX", "MAS", "AM", "X"]
+assert quest.count_words(words) == {word: quest.count_word(word) for word in words}
+for (start, dir) in test.count_words(["XMAS"], positions=True)["XMAS"]:
+    assert test.gather_chars(start, dir, 4) == "XMAS"
+
+# the X-MAS by hand, as count_x_mas was before it became a stencil
+def star_x_mas(puzzle: ws.Puzzle) -> int:
+    n = 0
+    for cell in puzzle.grid.find("A"):
+        star = {dir: puzzle.gather_chars(cell, dir, 2)[1:] for dir in ws.Direction}
+        if ({star[ws.Direction.UL], star[ws.Direction.LR]} == {"M", "S"} and
+            {star[ws.Direction.UR], star[ws.Direction.LL]} == {"M", "S"}): n += 1
+    return n
+assert quest.count_x_mas() == star_x_mas(quest)
+# the + shape (not the puzzle), mirrored rather than rotated
+assert quest.count_stencil([".M.", "MAS", ".S."], reflections=True) == len(quest.find_stencil([".M.", "MAS", ".S."], reflections=True))
+
+# a dictionary's worth of words: all 349524 words of up to 9 letters from XMAS, built and searched at once
+import itertools, random
+dictionary = ["".join(letters) for n in range(1, 10) for letters in itertools.product("XMAS", repeat=n)]
+counts = quest.count_words(dictionary)
+assert len(counts) == len(dictionary)
+for word in random.Random(0).sample(dictionary, 20) + ["XMAS", "SAMX"]:
+    assert counts[word] == quest.count_word(word), f"Test failed for {word}!\n  Expected: {quest.count_word(word)}\n  Actual: {counts[word]}"
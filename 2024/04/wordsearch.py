@@ -1,8 +1,10 @@
 from typing import Iterator
-from collections import Counter
 from enum import Enum
-from dataclasses import dataclass
-import numpy as np
+from aoc import lazy
+from aoc.grid import Grid, Point, stencil, variants, positions
+from aho_corasick import Automaton
+
+np = lazy.module("numpy")
 
 class Direction(Enum):
     UP    = (0 ,-1)
@@ -22,76 +24,106 @@ class Direction(Enum):
     def dy(self) -> int:
         return self.value[1]
 
-@dataclass(frozen=True)
-class Cell:
-    x: int
-    y: int
-    char: str
-
 class Puzzle:
 
     def __init__(self, input_str: str):
-        # Split the input string into lines and create the grid
-        lines = input_str.strip().split('\n')
-        self.height = len(lines)
-        self.width = len(lines[0]) if self.height > 0 else 0
-        self.cells = np.full((self.height, self.width), "", dtype=Cell)
-        self.chars: dict[str, set[Cell]] = {}
-
-        # Parse the input and populate the grid
-        for y, line in enumerate(lines):
-            for x, char in enumerate(line):
-                c = Cell(x, y, char)
-                self.cells[y][x] = c
-
-                # let's also store a reference by character for easy lookup
-                s = self.chars.get(char)
-                if s is None:
-                    self.chars.update({char: {c}})
-                else:
-                    s.add(c)
+        self.grid = Grid.from_string(input_str)
+        self.height = self.grid.height
+        self.width = self.grid.width
 
-    def get_cells(self) -> Iterator[Cell]:
+    def get_cells(self) -> Iterator[Point]:
         """Returns an iterator over all cells in the map, row by row."""
-        for row in self.cells:
-            yield from row
+        for y in range(self.height):
+            for x in range(self.width):
+                yield Point(x, y)
     
     def count_word(self, word="XMAS") -> int:
-        """Counts the occurance of a specified word in the Puzzle"""
+        """
+        Counts the occurance of a specified word in the Puzzle.
+
+        Compares the whole grid at once, for each direction and letter: a cell starts the word if it holds
+        the first letter, its neighbor in that direction the second one and so on, i.e. the k-th letter is
+        compared with the grid shifted k steps. The padding keeps the shifted views the size of the grid.
+        """
+        if not word:
+            return 0
+        grid = Grid(self.grid.cells, pad=max(1, len(word) - 1))
+        letters = word.encode()
+        first = grid.cells == letters[0]
         n = 0
-        for cell in self.chars.get(word[0]):
-            for dir in list(Direction):
-                if word == self.gather_chars(cell, dir, len(word)):
-                    n += 1
+        for dir in list(Direction):
+            found = first.copy()
+            for k in range(1, len(letters)):
+                found &= grid.shifted(dir.dx * k, dir.dy * k) == letters[k]
+            n += int(np.count_nonzero(found))
         return n
     
-    def gather_chars(self, start: Cell, dir: Direction, lenght: int) -> str:
+    def lines(self) -> Iterator[tuple[bytes, Point, Direction]]:
+        """
+        Every row, column and diagonal, each forward and backward, i.e. all lines a word can be written along.
+
+        Yields:
+            tuple[bytes, Point, Direction]: The characters, the cell of the first one and the reading direction.
+        """
+        cells = self.grid.cells
+        lines = [(row, Point(0, y), Direction.RIGHT) for y, row in enumerate(cells)]
+        lines += [(column, Point(x, 0), Direction.DOWN) for x, column in enumerate(cells.T)]
+        for offset in range(1 - self.height, self.width):
+            lines.append((cells.diagonal(offset), Point(max(0, offset), max(0, -offset)), Direction.LR))
+            # the diagonals of the mirrored grid run down to the left
+            lines.append((cells[:, ::-1].diagonal(offset), Point(self.width - 1 - max(0, offset), max(0, -offset)), Direction.LL))
+        for line, start, dir in lines:
+            line = line.tobytes()
+            yield line, start, dir
+            back = Direction((-dir.dx, -dir.dy))
+            yield line[::-1], start.step(dir.dx, dir.dy, len(line) - 1), back
+
+    def count_words(self, words: list[str], positions: bool = False) -> dict[str, int] | dict[str, list[tuple[Point, Direction]]]:
+        """
+        Counts the occurances of all words at once, like count_word for each, but in a single pass over every
+        line of the grid (see lines) through an Aho–Corasick automaton, i.e. linear in the size of the grid
+        however many words there are.
+
+        Args:
+            positions: Instead of counting, collect where each occurance starts and in which direction it reads.
+        """
+        words = list(dict.fromkeys(words))
+        automaton = Automaton([word.encode() for word in words])
+        found: list[list[tuple[Point, Direction]]] = [[] for _ in words]
+        counts = [0] * len(words)
+        for line, start, dir in self.lines():
+            for end, index in automaton.search(line):
+                counts[index] += 1
+                if positions:
+                    found[index].append((start.step(dir.dx, dir.dy, end - len(words[index]) + 1), dir))
+        if positions:
+            return dict(zip(words, found))
+        return dict(zip(words, counts))
+
+    def gather_chars(self, start: Point, dir: Direction, lenght: int) -> str:
         """Gathers all characters reading from a starting cell in a specific direction for a specified length."""
         word = ""
         for n in range(lenght):
             next_x = start.x + dir.dx * n
             next_y = start.y + dir.dy * n
-            if not (0 <= next_x < self.width and 0 <= next_y < self.height):
+            if not self.grid.in_bounds(next_x, next_y):
                 return word
-            next_c = self.cells[next_y][next_x]
-            word += next_c.char
+            word += self.grid[next_x, next_y]
         return word
     
-    def gather_cells(self, start: Cell, dir: Direction, lenght: int) -> str:
+    def gather_cells(self, start: Point, dir: Direction, lenght: int) -> list[Point]:
         """Gathers all cells reading from a starting cell in a specific direction for a specified length."""
         collection = []
         for n in range(lenght):
-            next_x = start.x + dir.dx * n
-            next_y = start.y + dir.dy * n
-            if not (0 <= next_x < self.width and 0 <= next_y < self.height):
+            next_c = start.step(dir.dx, dir.dy, n)
+            if not self.grid.in_bounds(*next_c):
                 return collection
-            next_c = self.cells[next_y][next_x]
             collection.append(next_c)
         return collection
     
-#    def find_word(self, word="MAS") -> list[list[Cell]]:
+#    def find_word(self, word="MAS") -> list[list[Point]]:
 #        findings = []
-#        for cell in self.chars.get(word[0]):
+#        for cell in self.grid.find(word[0]):
 #            for dir in list(Direction):
 #                if word == self.gather_chars(cell, dir, len(word)):
 #                    findings.append(self.gather_cells(cell, dir, len(word)))
@@ -100,32 +132,32 @@ class Puzzle:
 #    def count_x(self, word="MAS") -> int:
 #        findings = self.find_word(word)
 #        half_len = int((len(word)-1)/2)
-#        x_cells: list[Cell] = []
+#        x_cells: list[Point] = []
 #        for f in findings:
 #            x_cells.append(f[half_len])
 #        cnt = Counter(x_cells)  # Count how often each Cell is listed
 #        double_cnt = {key: value for key, value in cnt.items() if value > 1}  # Filter for entries with more than 1 occurrence
 #        return len(double_cnt)
 
-# they have actually to be in 90degree to eachother...    
+# they have actually to be in 90degree to eachother...
     def count_x_mas(self) -> int:
         """Counts how many time MAS appears overlapping itself in an X-shape."""
-        n = 0
-        word = "MAS" # cant be bothered to make it dynamic...
-        x_char = "A"
-        for cell in self.chars.get(x_char):
-            star: dict[Direction, str] = {} # let collect a char in each direction
-            for dir in list(Direction):
-                star[dir] = self.gather_chars(cell, dir, 2)[1:]
-            #if (
-            #    (star[Direction.LEFT]+x_char+star[Direction.RIGHT] == word or star[Direction.RIGHT]+x_char+star[Direction.LEFT] == word) and 
-            #    (star[Direction.UP]+x_char+star[Direction.DOWN] == word or star[Direction.DOWN]+x_char+star[Direction.UP] == word)
-            #): n += 1
-            if (
-                (star[Direction.UL]+x_char+star[Direction.LR] == word or star[Direction.LR]+x_char+star[Direction.UL] == word) and 
-                (star[Direction.UR]+x_char+star[Direction.LL] == word or star[Direction.LL]+x_char+star[Direction.UR] == word)
-            ): n += 1
-        return n
+        return self.count_stencil(["M.S",
+                                   ".A.",
+                                   "M.S"], rotations=True)
+
+    def count_stencil(self, pattern: list[str], wildcard: str = '.', rotations: bool = False, reflections: bool = False) -> int:
+        """
+        Counts where a 2D pattern appears, e.g. count_x_mas. Every distinct variant of the pattern
+        (optionally rotated by 90° steps and/or mirrored) is counted at each position it matches.
+        """
+        return sum(int(np.count_nonzero(self.grid.match(variant, wildcard)))
+                   for variant in variants(stencil(pattern), rotations, reflections))
+
+    def find_stencil(self, pattern: list[str], wildcard: str = '.', rotations: bool = False, reflections: bool = False) -> list[tuple[Point, 'np.ndarray']]:
+        """Top left cell and variant of each match of count_stencil, row by row for each variant."""
+        return [(point, variant) for variant in variants(stencil(pattern), rotations, reflections)
+                for point in positions(self.grid.match(variant, wildcard))]
 
 def load_puzzle(filename: str) -> Puzzle:
     with open(filename, 'r') as file:
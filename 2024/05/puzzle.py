@@ -0,0 +1,174 @@
+from collections import deque
+from itertools import chain
+from aoc import lazy
+
+np = lazy.module("numpy")
+
+def pack_updates(updates: list[list[int]]) -> tuple['np.ndarray', 'np.ndarray']:
+    """
+    Packs the updates into one array, padded to the longest with -1.
+
+    Returns:
+        np.ndarray: The pages, one update per row.
+        np.ndarray: The number of pages of each update.
+    """
+    lengths = np.fromiter(map(len, updates), dtype=np.int64, count=len(updates))
+    pages = np.full((len(updates), lengths.max(initial=0)), -1, dtype=np.int64)
+    pages[np.arange(pages.shape[1]) < lengths[:, None]] = np.fromiter(chain.from_iterable(updates), dtype=np.int64, count=lengths.sum())
+    return pages, lengths
+
+class RuleSet:
+    """The ordering rules, compiled once for checking any number of updates."""
+    def __init__(self, ordering_rules: list[tuple[int, int]]):
+        later_than: dict[int, set[int]] = {}
+        for first, after in ordering_rules:
+            later_than.setdefault(first, set()).add(after)
+        self.later_than: dict[int, frozenset[int]] = {page: frozenset(after) for page, after in later_than.items()}
+
+    def matrix(self, size: int) -> 'np.ndarray':
+        """Boolean [page, other] array of whether page has to come before other, for the pages below size."""
+        must_precede = np.zeros((size, size), dtype=bool)
+        for page, later in self.later_than.items():
+            if page < size:
+                must_precede[page, [after for after in later if after < size]] = True
+        return must_precede
+
+    def validate_all(self, pages: 'np.ndarray', lengths: 'np.ndarray') -> tuple['np.ndarray', 'np.ndarray']:
+        """
+        Checks all updates at once, same as is_ordered for each: for every distance d, the pages d apart
+        are looked up in the matrix of the rules, an update is out of order if any later page has to come
+        before an earlier one.
+
+        Args:
+            pages, lengths: The packed updates, see pack_updates.
+
+        Returns:
+            np.ndarray: Whether each update is in order.
+            np.ndarray: The middle page of each update (as it is, i.e. before ordering), 0 if it is empty.
+        """
+        highest = max(max(self.later_than, default=0), max(map(max, self.later_than.values()), default=0), pages.max(initial=0))
+        must_precede = self.matrix(highest + 2) # and the padding as a page without rules
+        pages = np.where(pages < 0, highest + 1, pages)
+        out_of_order = np.zeros(len(pages), dtype=bool)
+        for d in range(1, pages.shape[1]):
+            out_of_order |= must_precede[pages[:, d:], pages[:, :-d]].any(axis=1)
+        middles = np.zeros(len(pages), dtype=np.int64) # 0 for an empty update, rather than its padding
+        filled = lengths > 0
+        middles[filled] = pages[filled, (lengths[filled] - 1) // 2]
+        return ~out_of_order, middles
+
+    def precedes(self, page: int, other: int) -> bool:
+        return other in self.later_than.get(page, ())
+
+    def is_ordered(self, update: list[int]) -> bool:
+        """
+        Checks every rule of a page of the update against the position of its other page, if that is in the update too.
+        O(k + rules of the pages of the update).
+        """
+        position = {page: index for index, page in enumerate(update)}
+        for index, page in enumerate(update):
+            for after in self.later_than.get(page, ()):
+                if position.get(after, len(update)) < index:
+                    return False
+        return True
+
+    def reorder(self, update: list[int]) -> list[int]:
+        """
+        Orders the pages of an update by Kahn's algorithm on the rules between them: a page is next once all
+        pages which have to come before it are placed. O(k + rules of the pages of the update).
+        Pages without a rule between them keep their order.
+        """
+        pages = frozenset(update)
+        if len(pages) < len(update):
+            raise ValueError(f"The update {update} lists a page more than once")
+        later = {page: self.later_than.get(page, frozenset()) & pages for page in update} # the induced subgraph
+        indegree = dict.fromkeys(update, 0)
+        for page in update:
+            for after in later[page]:
+                indegree[after] += 1
+        ready = deque(page for page in update if indegree[page] == 0)
+        ordered: list[int] = []
+        while ready:
+            page = ready.popleft()
+            ordered.append(page)
+            for after in later[page]:
+                indegree[after] -= 1
+                if indegree[after] == 0:
+                    ready.append(after)
+        if len(ordered) < len(update):
+            raise ValueError(f"The rules between the pages of {update} are cyclic")
+        return ordered
+
+    def middle_page(self, update: list[int]) -> int:
+        """
+        The middle page of the ordered update, by quickselect with the rules as comparison, i.e. without
+        ordering the whole update. The pivot is the middle one of the pages left, so results are reproducible
+        (and O(k) on average for the puzzle input, whose updates are in no particular order).
+        Falls back to reorder if the pivot ends up with pages it has no rule with, which could go on either side.
+        """
+        if len(frozenset(update)) < len(update):
+            raise ValueError(f"The update {update} lists a page more than once")
+        pages = list(update)
+        index = (len(pages) - 1) // 2
+        while True:
+            pivot = pages[len(pages) // 2]
+            before = [page for page in pages if self.precedes(page, pivot)]
+            after = [page for page in pages if self.precedes(pivot, page)]
+            if len(before) + len(after) + 1 < len(pages):
+                return self.reorder(update)[(len(update) - 1) // 2]
+            if index < len(before):
+                pages = before
+            elif index >= len(pages) - len(after):
+                index -= len(pages) - len(after)
+                pages = after
+            else:
+                return pivot
+
+class Puzzle:
+    def __init__(self, ordering_rules: list[tuple[int, int]], updates: list[list[int]]):
+        self.rules = RuleSet(ordering_rules)
+        self.pages, self.lengths = pack_updates(updates)
+
+        self.updates = {
+            "toproc": updates,
+            "ordered": [],
+            "out_of_order": [] # as given, not reordered (their middle pages are selected, see do)
+        }
+        self.ordered_middle_pages: list[int] = []
+        self.out_of_order_middle_pages: list[int] = []
+
+    def validate_page_order(self, update: list[int]) -> bool:
+        # a page -> position map instead of the sets before and after every page, see RuleSet
+        return self.rules.is_ordered(update)
+
+    def do(self):
+        # all updates checked at once, only the out of order ones are handled one by one
+        in_order, middle_pages = self.rules.validate_all(self.pages, self.lengths)
+        for update, isInOrder, middle_page in zip(self.updates["toproc"], in_order.tolist(), middle_pages.tolist()):
+            if isInOrder:
+                self.updates["ordered"].append(update)
+                self.ordered_middle_pages.append(middle_page)
+            else: # i knew it! :D
+                # only its middle page counts, so it is selected rather than the whole update ordered
+                self.updates["out_of_order"].append(update)
+                self.out_of_order_middle_pages.append(self.rules.middle_page(update))
+
+    def checksum(self) -> int:
+        return sum(self.ordered_middle_pages)
+
+    def check_p2(self) -> int:
+        return sum(self.out_of_order_middle_pages)
+
+def load_puzzle(rules_file: str, updates_file: str) -> Puzzle:
+    """Load Puzzle from the ordering rules and the updates input files (paths)."""
+    ordering_rules: list[tuple[int, int]] = []
+    with open(rules_file, "r") as file:
+        for line in file:
+            first, after = map(int, line.split('|'))
+            ordering_rules.append((first, after))
+    updates: list[list[int]] = []
+    with open(updates_file, "r") as file:
+        for line in file:
+            update = list(map(int, line.split(',')))
+            updates.append(update)
+    return Puzzle(ordering_rules, updates)
@@ -1,6 +1,4 @@
 import map as m
-from map import Cell
-from tqdm import tqdm
 
 map = m.load_map('input.txt') # test / input
 
@@ -12,14 +10,17 @@ print("visited cells:", len(visited_cells)) # 41 / 4890
 map.reset()
 
 # Part 2
-looping_obstructions: set[Cell] = set()
-visited_cells.remove(map.starting_pos.cell) # let's try blocking every cell the guard would have visited and see if it would cause a loop (any other cell would have no impact on his path)
-for cell in tqdm(visited_cells, desc="Obstructing cells in happy path", unit="cell"): 
-    cell.set_obstacle()
-    exited = map.simulate_guard_movement()[1]
-    if not exited: 
-        looping_obstructions.add(cell)
-    cell.clear()
-    map.reset()
+# let's try blocking every cell the guard would have visited and see if it would cause a loop (any other cell would have no impact on his path)
+looping_obstructions = map.find_loop_obstructions()
 
-print("Possible positions for obstructions:", len(looping_obstructions)) # 6 / <2300!
\ No newline at end of file
+print("Possible positions for obstructions:", len(looping_obstructions)) # 6 / 1995
+
+# a guard who doesn't start facing up takes the same path with the jump table as step by step
+for symbol in '>v<':
+    turned = m.Map(open('test.txt').read().replace('^', symbol))
+    path, exited = turned.simulate_guard_movement()
+    turned.reset()
+    start = turned.starting_pos.cell
+    assert turned.simulate_turns()[0][0] == (start.x, start.y, turned.guard.direction)
+    if exited:
+        assert {(x, y) for x, y, _ in path} == {(start.x, start.y)} | {cell for cell, _ in turned.first_entries()}
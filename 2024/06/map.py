@@ -1,6 +1,13 @@
 from enum import Enum
-from typing import List, Optional, Tuple, Iterator
+from functools import partial
+from typing import Optional, Tuple, Iterator
 from dataclasses import dataclass
+from aoc import lazy
+from aoc.grid import Grid
+
+np = lazy.module("numpy")
+
+OBSTACLE = ord('#')
 
 class Direction(Enum):
     UP = ('^', 0, -1)
@@ -26,38 +33,37 @@ class Direction(Enum):
         return directions[(current_index + 1) % 4]
 
 class Cell:
-    def __init__(self, x: int, y: int):
+    """A cell of the map, a view of its character in the map's grid, equal to any other view of the same cell."""
+    def __init__(self, map: 'Map', x: int, y: int):
+        self.map = map
         self.x = x
         self.y = y
-        self.is_obstacle = False
-        self.guard_direction: Optional[Direction] = None
-#        self.visited = False   #this was just for the looks... and we cant afford it!
-    
+
+    @property
+    def is_obstacle(self) -> bool:
+        return self.map.rows[self.y][self.x] == OBSTACLE
+
+    @property
+    def guard_direction(self) -> Optional[Direction]:
+        return next((d for d in Direction if d.symbol == str(self)), None)
+
     def set_obstacle(self):
-        self.is_obstacle = True
-    
+        self.map.set_char(self.x, self.y, '#')
+
     def set_guard(self, direction: Direction):
-        self.is_obstacle = False
-        self.guard_direction = direction
-    
+        self.map.set_char(self.x, self.y, direction.symbol)
+
     def clear(self):
-        self.is_obstacle = False
-#        self.visited = False
-#
-#    def reset(self):
-#        self.visited = False
-#    
-#    def mark_visited(self):
-#        self.visited = True
-    
+        self.map.set_char(self.x, self.y, '.')
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Cell) and (self.map, self.x, self.y) == (other.map, other.x, other.y)
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y))
+
     def __str__(self) -> str:
-        if self.is_obstacle:
-            return '#'
-        elif self.guard_direction:
-            return self.guard_direction.symbol
- #       elif self.visited:
- #           return 'X'
-        return '.'
+        return chr(self.map.rows[self.y][self.x])
 
 @dataclass(frozen=True)
 class Position:
@@ -88,34 +94,35 @@ class Guard:
 
 class Map:
     def __init__(self, input_str: str):
-        # Split the input string into lines and create the grid
-        lines = input_str.strip().split('\n')
-        self.height = len(lines)
-        self.width = len(lines[0]) if self.height > 0 else 0
-        
-        # Initialize the map with empty cells
-        self.cells = [[Cell(x, y) for x in range(self.width)] for y in range(self.height)]
-        
-        # Parse the input and populate the grid
-        for y, line in enumerate(lines):
-            for x, char in enumerate(line):
-                if char == '#':
-                    self.get_cell(x, y).set_obstacle()
-                elif char in ('^', '>', 'v', '<'):
-                    direction = next(d for d in Direction if d.symbol == char)
-                    self.get_cell(x, y).set_guard(direction)
-                    self.guard = Guard(x, y, direction)
-                    self.starting_pos = Position(self.get_cell(x, y), Direction.UP)
-    
+        self.grid = Grid.from_string(input_str)
+        self.height, self.width = self.grid.height, self.grid.width
+        # the rows as bytes too, for the step by step simulation: indexing bytes is much faster than the array
+        self.rows = [row.tobytes() for row in self.grid.cells]
+        guards = self.grid.find(''.join(d.symbol for d in Direction))
+        if len(guards) != 1:
+            raise ValueError(f"Expected exactly one guard on the map, found {len(guards)}")
+        x, y = guards[0]
+        direction = next(d for d in Direction if d.symbol == self.grid[x, y])
+        self.guard = Guard(x, y, direction)
+        self.starting_pos = Position(self.get_cell(x, y), direction)
+        self._jumps: dict[Direction, 'np.ndarray'] | None = None
+
     def get_cell(self, x: int, y: int) -> Optional[Cell]:
         if 0 <= x < self.width and 0 <= y < self.height:
-            return self.cells[y][x]
+            return Cell(self, x, y)
         return None
-    
+
     def get_cells(self) -> Iterator[Cell]:
         """Returns an iterator over all cells in the map, row by row."""
-        for row in self.cells:
-            yield from row
+        for y in range(self.height):
+            for x in range(self.width):
+                yield Cell(self, x, y)
+
+    def set_char(self, x: int, y: int, char: str):
+        """Changes a cell of the map (see Cell), the jumps are rebuilt on their next use."""
+        self.grid[x, y] = char
+        self.rows[y] = self.grid.cells[y].tobytes()
+        self._jumps = None
 
     def reset(self):
         """Resets the map to it's original state."""
@@ -147,17 +154,118 @@ class Map:
             path.add(pos)
             
             # Handle obstacles and movement
-            x, y = guard.move()       
-            try:
-                while self.cells[y][x].is_obstacle:
-                    guard.turn_right()
-                    x, y = guard.move()
-            except IndexError:
+            x, y = guard.move()
+            # no IndexError to rely on when leaving to the top or left, negative indices wrap around
+            while 0 <= x < self.width and 0 <= y < self.height and self.rows[y][x] == OBSTACLE:
+                guard.turn_right()
+                x, y = guard.move()
+            if not (0 <= x < self.width and 0 <= y < self.height):
                 return path, True #we'd leave the map
             guard.x, guard.y = x, y
     
+    def jumps(self) -> dict[Direction, 'np.ndarray']:
+        """
+        The next obstacle ahead of the guard, for each direction and [y, x] cell: its x (when moving LEFT or RIGHT)
+        or y (UP or DOWN), or -1 / the width / the height if there is none, i.e. they would leave the map.
+        Built on first use with running maxima/minima over the whole grid, and again after a cell changed.
+        """
+        if self._jumps is None:
+            obstacles = self.grid.cells == OBSTACLE
+            dtype = np.int16 if max(self.width, self.height) < 2**15 - 1 else np.int32
+            xs = np.arange(self.width, dtype=dtype)[np.newaxis, :]
+            ys = np.arange(self.height, dtype=dtype)[:, np.newaxis]
+            self._jumps = {
+                Direction.LEFT: np.maximum.accumulate(np.where(obstacles, xs, -1), axis=1),
+                Direction.RIGHT: np.minimum.accumulate(np.where(obstacles, xs, self.width)[:, ::-1], axis=1)[:, ::-1],
+                Direction.UP: np.maximum.accumulate(np.where(obstacles, ys, -1), axis=0),
+                Direction.DOWN: np.minimum.accumulate(np.where(obstacles, ys, self.height)[::-1], axis=0)[::-1],
+            }
+        return self._jumps
+
+    def simulate_turns(self, start: Optional[Tuple[int, int, Direction]] = None,
+                       obstacle: Optional[Tuple[int, int]] = None) -> Tuple[list[Tuple[int, int, Direction]], bool]:
+        """
+        Same as simulate_guard_movement, but the guard jumps from turn to turn (see jumps), i.e. O(turns) instead
+        of O(path length). Leaves the guard and the cells alone.
+
+        Args:
+            start: (x, y, direction) of the guard, default: the starting position.
+            obstacle: (x, y) of an extra obstacle, instead of setting it on its cell.
+
+        Returns:
+            list[Tuple[int, int, Direction]]: The position of the guard at the start and after each turn.
+            bool: Whether the guard exited the map.
+        """
+        jumps = self.jumps()
+        x, y, direction = start or (self.starting_pos.cell.x, self.starting_pos.cell.y, self.starting_pos.direction)
+        ox, oy = obstacle or (-1, -1)
+        seen: set[Tuple[int, int, Direction]] = set()
+        turns: list[Tuple[int, int, Direction]] = []
+        while True:
+            pos = (x, y, direction)
+            if pos in seen:
+                return turns, False
+            seen.add(pos)
+            turns.append(pos)
+
+            ahead = int(jumps[direction][y, x])
+            if direction.dx:
+                # the extra obstacle, if it is ahead in this row and not behind the next one
+                if oy == y and (ox - x) * direction.dx > 0 and (ahead - ox) * direction.dx >= 0:
+                    ahead = ox
+                if not 0 <= ahead < self.width:
+                    return turns, True
+                x = ahead - direction.dx
+            else:
+                if ox == x and (oy - y) * direction.dy > 0 and (ahead - oy) * direction.dy >= 0:
+                    ahead = oy
+                if not 0 <= ahead < self.height:
+                    return turns, True
+                y = ahead - direction.dy
+            direction = direction.turn_right()
+
+    def first_entries(self) -> list[Tuple[Tuple[int, int], Tuple[int, int, Direction]]]:
+        """
+        Every cell the guard enters on their way off the map (but the starting cell), in order,
+        with the (x, y, direction) of the guard just before they enter it for the first time.
+        """
+        turns, exited = self.simulate_turns()
+        if not exited:
+            raise ValueError("The guard never leaves the map")
+        start = self.starting_pos.cell
+        entered = {(start.x, start.y)}
+        entries = []
+        for i, (x, y, direction) in enumerate(turns):
+            end = turns[i + 1][:2] if i + 1 < len(turns) else None # the last leg leads off the map
+            while (x, y) != end and 0 <= x + direction.dx < self.width and 0 <= y + direction.dy < self.height:
+                state = (x, y, direction)
+                x, y = x + direction.dx, y + direction.dy
+                if (x, y) not in entered:
+                    entered.add((x, y))
+                    entries.append(((x, y), state))
+        return entries
+
+    def find_loop_obstructions(self) -> set[Tuple[int, int]]:
+        """
+        All cells where a new obstacle makes the guard loop. Only the cells they enter can matter, and the way up
+        to such a cell doesn't change, so each check resumes from the guard just in front of it rather than from
+        the start. The checks are split between the shared worker pool.
+        """
+        from aoc import workers
+        entries = self.first_entries()
+        self.jumps() # once, rather than in every worker
+        shards = workers.size()
+        looping: set[Tuple[int, int]] = set()
+        for found in workers.map(partial(_looping, self), [entries[i::shards] for i in range(shards)]):
+            looping.update(found)
+        return looping
+
     def __str__(self) -> str:
-        return '\n'.join(''.join(str(cell) for cell in row) for row in self.cells)
+        return str(self.grid)
+
+def _looping(map: Map, entries: list[Tuple[Tuple[int, int], Tuple[int, int, Direction]]]) -> list[Tuple[int, int]]:
+    """The cells of a shard of find_loop_obstructions which make the guard loop."""
+    return [cell for cell, state in entries if not map.simulate_turns(start=state, obstacle=cell)[1]]
 
 def load_map(filename: str) -> Map:
     with open(filename, 'r') as file:
@@ -0,0 +1,77 @@
+from enum import Enum
+import itertools
+from aoc import metrics
+#import math
+
+class Operator(Enum):
+    ADD = ('+')
+    MULTIPLY = ('*')
+    CONCAT = ('||')
+    #i knew it! :D
+    
+    @property
+    def symbol(self) -> str:
+        return self.value[0]
+    
+def load_equations(filename: str) -> dict[int, list[int]]:
+    equations = {}
+    with open(filename, 'r') as file:
+        for line in file:
+            total, operands = line.split(':')
+            total = int(total)
+            operands = list(map(int, operands.strip().split()))
+            equations[total] = operands
+    return equations
+
+def guess_operators(total: int, operands: list[int], operators: tuple[Operator, ...] = tuple(Operator)) -> bool:
+    """Tries to combine the given operands using a combination of the provided operators to reach the total. Returns True if successfull."""
+
+    configurations = list(itertools.product(operators, repeat=len(operands)-1)) #generates all possible combinations of the provided operators
+    for config in configurations:
+        
+        subtotal = operands[0]
+        for operator, operand in zip(config, operands[1:]): #iterates through operands & operators in parallel and increments the subtotal accordingly
+            if subtotal > total: # break early if we have already exceed the total (since we only support increasing operators, and there are no 0 operands)
+                break
+            match operator:
+                case Operator.ADD: subtotal += operand
+                case Operator.MULTIPLY: subtotal *= operand
+                case Operator.CONCAT: subtotal = int(str(subtotal)+str(operand)) # down from subsecond to 1min 30s... we can do better, right? let's do away with type casting
+                #case Operator.CONCAT: subtotal = subtotal*10**(math.floor(math.log10(operand)) + 1) + operand #multiplying subtotal by 10 to the power of number of digits of operand to make space for it... still takes 1min 20s
+                #case Operator.CONCAT: subtotal = subtotal*10**(len(str(operand))) + operand #maybe math was slow? still 1min 20s
+                #case Operator.CONCAT: #uhm let's try increment only...
+                #    subtotal *=10**(len(str(operand))) 
+                #    subtotal += operand # 1min 25s
+                # conclusion: the perf impact was propbly just from adding an additional dimension of operators and not bc of its implemantion
+
+        if subtotal == total:
+            return True
+        
+    return False
+
+def validate_totals(equations: dict[int, list[int]], operators: tuple[Operator, ...] = tuple(Operator)) -> list[int]:
+    """ Validates each total of a dict of equations returning only valid totals (aka test values). """
+    valid_testvalues = []
+    for total, operands in metrics.progress(equations.items(), "Validationg test values of equations", unit="equation"):
+        if guess_operators(total, operands, operators):
+            valid_testvalues.append(total)
+    return valid_testvalues
+
+class Puzzle:
+    def __init__(self, equations: dict[int, list[int]]):
+        self.equations = equations
+        self.valid_testvalues: list[int] = []
+
+    def do(self, operators: tuple[Operator, ...] = (Operator.ADD, Operator.MULTIPLY)):
+        self.valid_testvalues = validate_totals(self.equations, operators)
+
+    def checksum(self) -> int:
+        return sum(self.valid_testvalues)
+
+    def check_p2(self) -> int:
+        self.do(tuple(Operator))
+        return self.checksum()
+
+def load_puzzle(input_file: str) -> Puzzle:
+    """Load Puzzle from input file (path)."""
+    return Puzzle(load_equations(input_file))
@@ -1,61 +1,32 @@
 from typing import Iterator
-from dataclasses import dataclass
-import numpy as np
 import itertools
-
-
-@dataclass
-class Cell:
-    x: int
-    y: int
-    antenna: str
-    antinode: bool
-
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __eq__(self, other):
-        if isinstance(other, Cell):
-            return (self.x, self.y) == (other.x, other.y)
-        return False
+from aoc.grid import Grid as CharGrid, Point, positions
 
 class Grid:
     def __init__(self, input_str: str):
-        # Split the input string into lines and create the grid
-        lines = input_str.strip().split('\n')
-        self.height = len(lines)
-        self.width = len(lines[0]) if self.height > 0 else 0
-        self.cells = np.full((self.height, self.width), "", dtype=Cell)
-        self.antennas: dict[str, set[Cell]] = {}
-        self.antinodes: set[Cell] = set()
-
-        # Parse the input and populate the grid
-        for y, line in enumerate(lines):
-            for x, char in enumerate(line):
-                antenna = char if char != '.' else None
-                c = Cell(x, y, antenna, False)
-                self.cells[y][x] = c
+        self.grid = CharGrid.from_string(input_str)
+        self.height = self.grid.height
+        self.width = self.grid.width
+        self.antinodes: set[Point] = set()
 
-                # let's also store a reference by antenna for easy lookup
-                if antenna:
-                    s = self.antennas.get(antenna)
-                    if s is None:
-                        self.antennas.update({antenna:  {c}})
-                    else:
-                        s.add(c)
+        # let's also store a reference by antenna for easy lookup
+        self.antennas: dict[str, list[Point]] = {}
+        for pos in positions(~self.grid.mask('.')):
+            self.antennas.setdefault(self.grid[pos], []).append(pos)
 
-    def get_cells(self) -> Iterator[Cell]:
+    def get_cells(self) -> Iterator[Point]:
         """Returns an iterator over all cells in the map, row by row."""
-        for row in self.cells:
-            yield from row
+        for y in range(self.height):
+            for x in range(self.width):
+                yield Point(x, y)
     
-    def find_cells_by_steps(self, start_y, start_x, dy, dx) -> list[Cell]:
+    def find_cells_by_steps(self, start_y, start_x, dy, dx) -> list[Point]:
         """ Find all cells starting at a specified coordinate using a regular distance pattern (incl. starting point). """
         cells = []
         y, x = start_y, start_x
         # Iterate until we go out of bounds
         while 0 <= y < self.height and 0 <= x < self.width:
-            cells.append(self.cells[y][x])
+            cells.append(Point(x, y))
             y += dy
             x += dx
         return cells
@@ -85,11 +56,9 @@ class Grid:
     
     def register_antinode(self, y: int, x: int):
         """ Register an antinode at the specified coordinates if they're valid. """
-        if 0 <= x < self.width and 0 <= y < self.height:
-            n: Cell = self.cells[y][x]
-            n.antinode = True
-            self.antinodes.add(n)
+        if self.grid.in_bounds(x, y):
+            self.antinodes.add(Point(x, y))
 
 def load_puzzle(filename: str) -> Grid:
     with open(filename, 'r') as file:
-        return Grid(file.read())
\ No newline at end of file
+        return Grid(file.read())
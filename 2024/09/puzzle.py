@@ -1,5 +1,5 @@
 from itertools import repeat
-from tqdm import tqdm
+from aoc import metrics
     
 class DiskMap:
     def __init__(self, data: str):
@@ -48,7 +48,7 @@ class DiskMap:
     
     def compact_files(self):
         """ Shift entire files (processed from right to left) into free spaces (processed left to right), without fragmentating the files. """
-        for file_id, file_size in tqdm(reversed(list(enumerate(self.files))), desc="Compacting Files", unit="file"):
+        for file_id, file_size in metrics.progress(reversed(list(enumerate(self.files))), "Compacting Files", unit="file", total=len(self.files)):
             free_blocks = 0
             for idx, space_id in enumerate(self.blocks):
                 if space_id == -1: 
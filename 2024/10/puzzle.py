@@ -1,125 +1,90 @@
 from typing import Iterator
 from dataclasses import dataclass
-import numpy as np
-from tqdm import tqdm
 from itertools import product
+from aoc.grid import Grid, Point, ORTHOGONAL
+from aoc import lazy, metrics
 
-@dataclass
-class Cell:
-    x: int
-    y: int
-    h: int
-
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __eq__(self, other):
-        if isinstance(other, Cell):
-            return (self.x, self.y) == (other.x, other.y)
-        return False
+np = lazy.module("numpy")
 
 @dataclass
 class Trail:
-    start: Cell
-    routes: list[set[Cell]]
+    start: Point
+    routes: list[set[Point]]
     score: int
 
     def __hash__(self):
-        return hash(self.head)
+        return hash(self.start)
 
     def __eq__(self, other):
         if isinstance(other, Trail):
-            return self.head == other.head
+            return self.start == other.start
         return False
 
 class Map:
     def __init__(self, input_str: str):
-        # Split the input string into lines and create the grid
-        lines = input_str.strip().split('\n')
-        self.height = len(lines)
-        self.width = len(lines[0]) if self.height > 0 else 0
-        self.cells = np.full((self.height, self.width), "", dtype=Cell)
+        self.grid = Grid.from_string(input_str)
+        self.height = self.grid.height
+        self.width = self.grid.width
+        # padded like the grid, the padding is never an elevation we seek
+        self.heights = self.grid.data.astype(np.int8) - ord('0')
         self.trails: list[Trail] = []
         self.score = 0
         self.rating = 0
 
-        # Parse the input and populate the grid
-        for y, line in enumerate(lines):
-            for x, char in enumerate(line):
-                h = int(char)
-                c = Cell(x, y, h)
-                self.cells[y][x] = c
-
-    def get_cells(self) -> Iterator[Cell]:
+    def get_cells(self) -> Iterator[Point]:
         """Returns an iterator over all cells in the map, row by row."""
-        for row in self.cells:
-            yield from row
+        for y in range(self.height):
+            for x in range(self.width):
+                yield Point(x, y)
+
+    def get_height(self, cell: Point) -> int:
+        return int(self.heights[cell.y + self.grid.pad, cell.x + self.grid.pad])
 
     def discover_trails(self):
         """Finds all Trails on the Map and update the Map's score & rating accordingly."""
-        for cell in tqdm(self.get_cells(), desc="Discovering Trails", unit="cell"):
-            if cell.h == 0:
-                routes = self.find_routes(cell)
-                score = self.score_routes(routes)
-                trail = Trail(cell, routes, score)
-                if score > 0:
-                    self.trails.append(trail)
-                    self.score += score
-                    rating = self.rate_trail(trail)
-                    self.rating += rating
+        for cell in metrics.progress(self.grid.find('0'), "Discovering Trails", unit="trailhead"):
+            routes = self.find_routes(cell)
+            score = self.score_routes(routes)
+            trail = Trail(cell, routes, score)
+            if score > 0:
+                self.trails.append(trail)
+                self.score += score
+                rating = self.rate_trail(trail)
+                self.rating += rating
         return
 
-    def find_routes(self, start: Cell, slope=1) -> list[set[Cell]]:
+    def find_routes(self, start: Point, slope=1) -> list[set[Point]]:
         """Finds all Routes for a Cell with an even gradual slope."""
-        routes: list[set[Cell]] = [{start}]
-        neighbors: set[Cell] = self.find_elevated_neighbor(start, slope)
+        routes: list[set[Point]] = [{start}]
+        neighbors: set[Point] = self.find_elevated_neighbor(start, slope)
         while neighbors:
             routes.append(neighbors)
             neighbors = {neighbor for n in neighbors for neighbor in self.find_elevated_neighbor(n)}
         return routes
     
-    def find_elevated_neighbor(self, cell: Cell, delta_h=1) -> set[Cell]:
+    def find_elevated_neighbor(self, cell: Point, delta_h=1) -> set[Point]:
         """Find all neigbors that are elevated by a specific height."""
+        pad = self.grid.pad
         x = cell.x
         y = cell.y
-        seek_h = cell.h + delta_h
-
-        neighbors: set[Cell] = set()
-
-        if 0 <= y-1 < self.height:
-            n = self.cells[y-1][x]
-            if n.h == seek_h:
-                neighbors.add(n)
-       
-        if 0 <= y+1 < self.height:
-            n = self.cells[y+1][x]
-            if n.h == seek_h:
-                neighbors.add(n)
-        
-        if 0 <= x-1 < self.width:
-            n = self.cells[y][x-1]
-            if n.h == seek_h:
-                neighbors.add(n)
+        seek_h = self.heights[y + pad, x + pad] + delta_h
 
-        if 0 <= x+1 < self.width:
-            n = self.cells[y][x+1]
-            if n.h == seek_h:
-                neighbors.add(n)
-        
+        neighbors: set[Point] = set()
+        for dx, dy in ORTHOGONAL:
+            if self.heights[y + dy + pad, x + dx + pad] == seek_h: # no bounds checking thanks to the padding
+                neighbors.add(Point(x + dx, y + dy))
         return neighbors
     
-    def is_neighbor(self, this: Cell, other: Cell) -> bool:
-        dx = abs(this.x - other.x)
-        dy = abs(this.y - other.y)
-        return dx+dy <= 1
+    def is_neighbor(self, this: Point, other: Point) -> bool:
+        return this.distance(other) <= 1
             
-    def is_valid_path(self, path: tuple[Cell, ...]) -> bool:
+    def is_valid_path(self, path: tuple[Point, ...]) -> bool:
         for next_lvl, level in zip(path[1:] , path):
             if not self.is_neighbor(level, next_lvl):
                 return False
         return True
     
-    def score_routes(self, routes: list[set[Cell]]) -> int:
+    def score_routes(self, routes: list[set[Point]]) -> int:
         "Score a Trail based on how many heads can be reached."
         score = len(routes[9]) if len(routes) > 9 else 0
         return score
@@ -138,4 +103,4 @@ class Map:
 
 def load_puzzle(filename: str):
     with open(filename, 'r') as file:
-        return Map(file.read())
\ No newline at end of file
+        return Map(file.read())
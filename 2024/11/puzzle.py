@@ -1,5 +1,5 @@
-from tqdm import tqdm
 from collections import Counter
+from aoc import metrics
 
 class PlutonianPebbles:
 
@@ -7,7 +7,7 @@ class PlutonianPebbles:
         self.stones = Counter(int(x) for x in data.split()) # let's process every unique engraving only once!
 
     def blink(self, repeat=1):
-        for _ in tqdm(range(repeat), desc="Blinking...", unit="blink"):
+        for _ in metrics.progress(range(repeat), "Blinking...", unit="blink"):
             new_stones = Counter()
             for engraving, count in self.stones.items():
                 engraving_str = str(engraving)
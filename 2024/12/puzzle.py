@@ -1,102 +1,68 @@
-from typing import Iterator, Tuple
-from dataclasses import dataclass
-import numpy as np
-from tqdm import tqdm
+from typing import Iterator
+from aoc.grid import ORTHOGONAL, Grid, Point
+from aoc import lazy
 
-@dataclass
-class Cell:
-    x: int
-    y: int
-    plant: str
-
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __eq__(self, other):
-        if isinstance(other, Cell):
-            return (self.x, self.y) == (other.x, other.y)
-        return False
+np = lazy.module("numpy")
 
 class Region:
-    def __init__(self, cell: Cell):
-        self.plant = cell.plant
-        self.plots: dict[Tuple[int,int], Cell] = {(cell.x, cell.y): cell}
-        self.area = 1
-        self.perimeter = 4
-
-    @classmethod
-    def from_regions(cls, regions: list["Region"]) -> "Region":
-        first_cell = next(iter(regions[0].plots.values()))
-        new_region = cls(first_cell)
-
-        merged_cells = set()
-        for region in regions:
-            merged_cells.update(region.plots.values())
-        for c in merged_cells:
-            if c != first_cell:
-                new_region.add_plot(c)
-        return new_region
-    
-    def merge(self, other: "Region"):
-        for c in other.plots.values():
-            if c not in self.plots.values():
-                self.add_plot(c)
-    
-    def add_plot(self, cell: Cell):
-        """Adds the Cell to the Plots of this Region.""" #, if it contains the same Plant
-        #if cell.plant == self.plant and cell not in self.plots.values():
-        self.plots[(cell.x, cell.y)] = cell
-        self.area += 1
-        n = self.count_n(cell)
-        self.perimeter += 4-(2*n)
-        return
+    def __init__(self, plant: str, area: int, perimeter: int):
+        self.plant = plant
+        self.area = area
+        self.perimeter = perimeter
 
-    def count_prev_neighbors(self, cell: Cell) -> int:
-        """Counts the number of *previous* neighbors in the Region."""
-        return sum(1 for x, y in [(cell.x - 1, cell.y), (cell.x, cell.y - 1)] if self.plots.get((x, y)))
-    
-    def count_n(self, cell: Cell) -> int:
-        """Counts the number of neighbors in the Region."""
-        return sum(1 for x, y in [(cell.x - 1, cell.y), (cell.x, cell.y - 1), (cell.x + 1, cell.y), (cell.x, cell.y + 1)] if self.plots.get((x, y)))
-    
     def price(self) -> int:
         return self.area * self.perimeter
     
     def __repr__(self):
         return f"{self.plant}: {self.price()}"
 
+def label_regions(grid: Grid) -> 'np.ndarray':
+    """
+    [y, x] array of the region of each plot, named after its first plot (y * width + x). Neighbors with the same
+    plant are merged as a union-find on whole arrays: every root hooks onto the smallest root it shares an edge
+    with, then the paths are halved until each plot points at its root, until no edge joins two roots.
+    """
+    cells = grid.cells
+    index = np.arange(cells.size).reshape(cells.shape)
+    same_right = cells[:, :-1] == cells[:, 1:]
+    same_below = cells[:-1] == cells[1:]
+    a = np.concatenate((index[:, :-1][same_right], index[:-1][same_below]))
+    b = np.concatenate((index[:, 1:][same_right], index[1:][same_below]))
+    parent = np.arange(cells.size)
+    while True:
+        ra, rb = parent[a], parent[b]
+        apart = ra != rb
+        if not apart.any():
+            return parent.reshape(cells.shape)
+        a, b, ra, rb = a[apart], b[apart], ra[apart], rb[apart]
+        np.minimum.at(parent, np.maximum(ra, rb), np.minimum(ra, rb))
+        while True:
+            jumped = parent[parent]
+            if np.array_equal(jumped, parent):
+                break
+            parent = jumped
+
 class Map:
     def __init__(self, input_str: str):
-        lines = input_str.strip().split('\n')
-        self.height = len(lines)
-        self.width = len(lines[0]) if self.height > 0 else 0
-        self.cells = np.full((self.height, self.width), "", dtype=Cell)
-        self.regions: dict[str, list[Region]] = {} #by plant
-
-        for y, line in enumerate(lines):
-            for x, char in enumerate(line):
-                plant = char
-                c = Cell(x, y, plant)
-                self.cells[y][x] = c
+        self.grid = Grid.from_string(input_str)
+        self.height = self.grid.height
+        self.width = self.grid.width
+        self.labels = label_regions(self.grid)
 
-                regions = self.regions.pop(plant, [Region(c)])
-                n_regions = [r for r in regions if r.count_prev_neighbors(c) > 0]
-                if len(n_regions)>1:
-                    merged_region = Region(c)
-                    for r in n_regions:
-                        merged_region.merge(r)
-                        regions.remove(r)
-                    regions.append(merged_region)
-                elif len(n_regions)==1:
-                    n_regions[0].add_plot(c)
-                else:
-                    regions.append(Region(c))
-                self.regions[plant] = regions
+        # a plot adds a fence to the perimeter for each neighbor which isn't the same plant (off the grid is padding)
+        fences = 4 - sum((self.grid.shifted(dx, dy) == self.grid.cells).astype(np.int8) for dx, dy in ORTHOGONAL)
+        areas = np.bincount(self.labels.ravel(), minlength=self.labels.size)
+        perimeters = np.bincount(self.labels.ravel(), weights=fences.ravel(), minlength=self.labels.size).astype(np.int64)
+        self.regions: dict[str, list[Region]] = {} #by plant
+        for label in np.flatnonzero(areas).tolist():
+            plant = chr(self.grid.cells.flat[label])
+            self.regions.setdefault(plant, []).append(Region(plant, int(areas[label]), int(perimeters[label])))
 
-    def get_cells(self) -> Iterator[Cell]:
+    def get_cells(self) -> Iterator[Point]:
         """Returns an iterator over all cells in the map, row by row."""
-        for row in self.cells:
-            yield from row
+        for y in range(self.height):
+            for x in range(self.width):
+                yield Point(x, y)
 
     def total_price(self) -> int:
         return sum(r.price() for region_list in self.regions.values() for r in region_list)
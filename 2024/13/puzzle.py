@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 import re
-from tqdm import tqdm
 from math import gcd
+from aoc import metrics
 
 @dataclass
 class Button:
@@ -22,7 +22,7 @@ class Arcade:
         self.machines: list[Machine] = self.parse_machine_configs(machine_configs)
         self.optimals: list[tuple[int, int, int]] = [] #Na, Nb, C
 
-        for m in tqdm(self.machines, desc="Simulating optimal plays", unit="machine"):
+        for m in metrics.progress(self.machines, "Simulating optimal plays", unit="machine"):
             optimum = self.derive_optimal_play(m)
             self.optimals.append(optimum)
         
@@ -1,5 +1,5 @@
 import puzzle
-from tqdm import tqdm
+from aoc import metrics
 
 test = puzzle.load_puzzle('input/test.txt', 11, 7)
 test.tick()
@@ -14,7 +14,7 @@ print("Quest Checksum:", actual)
 
 part2 = puzzle.load_puzzle('input/quest.txt', 101, 103)
 n_max = 101 * 103 + 1
-for n in tqdm(range(1, n_max), desc="Looking for a christmas tree...", unit="tick"):
+for n in metrics.progress(range(1, n_max), "Looking for a christmas tree...", unit="tick"):
     part2.tick(1)
 
     if part2.may_look_like_a_christmas_tree():
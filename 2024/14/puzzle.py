@@ -1,7 +1,9 @@
 from collections import Counter
 from functools import reduce
 from operator import mul
-import numpy as np
+from aoc import lazy
+
+np = lazy.module("numpy")
 
 class Robot:
     def __init__(self, x: int, y: int, vx: int, vy:int):
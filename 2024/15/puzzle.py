@@ -1,8 +1,9 @@
-from typing import Iterator, Optional
+from typing import Iterator
 from enum import Enum
-from dataclasses import dataclass
-import numpy as np
-from tqdm import tqdm
+from aoc.grid import Grid, Point
+from aoc import lazy, metrics
+
+np = lazy.module("numpy")
 
 class Direction(Enum):
     UP = ('^', 0, -1)
@@ -34,157 +35,83 @@ class Ptype(Enum):
     BOX   = 'O'
     ROBOT = '@'
     EMPTY = '.'
+    BOX_LEFT  = '[' # the map is twice as wide, so every box has two halves
+    BOX_RIGHT = ']'
 
     def __str__(self):
         return self.value
 
-@dataclass
-class Cell:
-    x: int
-    y: int
-    ptype: Ptype #transient
-    other_half: Optional["Cell"]
-
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __eq__(self, other):
-        if isinstance(other, Cell):
-            return (self.x, self.y) == (other.x, other.y)
-        return False
-    
-    def __str__(self):
-        return str(self.ptype)
+WIDEN = str.maketrans({
+    Ptype.WALL.value:  Ptype.WALL.value * 2,
+    Ptype.BOX.value:   Ptype.BOX_LEFT.value + Ptype.BOX_RIGHT.value,
+    Ptype.ROBOT.value: Ptype.ROBOT.value + Ptype.EMPTY.value,
+    Ptype.EMPTY.value: Ptype.EMPTY.value * 2,
+})
 
 class Map:
     def __init__(self, map_data: str, moves_data: str):
         self.moves = self.parse_moves_config(moves_data)
-        lines = map_data.strip().split('\n')
-        self.height = len(lines)
-        self.width = len(lines[0])*2 if self.height > 0 else 0
-        self.cells = np.empty((self.height, self.width), dtype=Cell)
-        # Parse the input and populate the grid 
-        for y, line in enumerate(lines):
-            for x, char in enumerate(line):
-                x = x*2
-                ptype = Ptype(char)
-                if ptype==Ptype.ROBOT:
-                    c_half = Cell(x, y, ptype, None)
-                    c_other = Cell(x+1, y, Ptype.EMPTY, None)
-                    self.robot = c_half
-                else:
-                    c_half = Cell(x, y, ptype, None)
-                    c_other = Cell(x+1, y, ptype, None)
-                if ptype == Ptype.BOX:
-                    c_half.other_half = c_other
-                    c_other.other_half = c_half
-                self.cells[y][x] = c_half
-                self.cells[y][x+1] = c_other
+        self.grid = Grid.from_string(map_data.strip().translate(WIDEN))
+        self.height = self.grid.height
+        self.width = self.grid.width
+        self.robot = self.grid.find_one(Ptype.ROBOT.value)
 
     def __str__(self) -> str:
-        str_grid = self.cells.astype(str)
-        # Join each row into a single string, then join rows with newlines
-        return '\n'.join(''.join(row) for row in str_grid)
+        return str(self.grid)
 
-    def get_cells(self) -> Iterator[Cell]:
+    def get_cells(self) -> Iterator[Point]:
         """Returns an iterator over all cells in the map, row by row, left to right."""
-        for row in self.cells:
-            yield from row
+        for y in range(self.height):
+            for x in range(self.width):
+                yield Point(x, y)
 
     def checksum(self) -> int:
-        score = 0
-        ignore: list[Cell] = []
-        for cell in self.get_cells():
-            if cell.ptype==Ptype.BOX and cell not in ignore:
-                gps = 100 * cell.y + cell.x
-                score += gps
-                ignore.append(cell.other_half)
-        return score
+        ys, xs = np.nonzero(self.grid.mask(Ptype.BOX_LEFT.value))
+        return int(np.sum(100 * ys + xs))
     
     def do(self):
-        for dir in tqdm(self.moves, desc="Simulationg moves...", unit="move"):
+        for dir in metrics.progress(self.moves, "Simulationg moves...", unit="move"):
             self.move_piece(self.robot, dir)
 
-    def can_move(self, piece: Cell, dir: Direction) -> bool:
-        """Checks if the piece on the given cell could move in a given direction and handles obstacles recursively. Returns True if successfull."""
-        if piece.ptype in [Ptype.WALL, Ptype.EMPTY]:
-            return False
-        target: Cell = self.cells[piece.y + dir.dy][piece.x + dir.dx]
-        if target == piece.other_half:
-            return self.can_move(target, dir)
-        if target.ptype == Ptype.WALL:
-            return False
-        if target.ptype == Ptype.BOX:
-            return self.can_move(target, dir) and self.can_move(target.other_half, dir)
-        #if target.ptype == Ptype.EMPTY or BOX moved succefully
-        #if piece.ptype == Ptype.BOX:
-         #   twin_success = self.can_move(piece.other_half, dir)
-        return True
+    def can_move(self, piece: Point, dir: Direction) -> bool:
+        """Checks if the piece on the given cell could move in a given direction incl. all pieces it would push."""
+        return bool(self.build_move(piece, dir))
 
-    def build_move(self, piece: Cell, dir: Direction, moving: list[Cell] = []) -> list[Cell]:
-        """Builds a move chain for the piece on the given cell in a given direction. Returns all cells in the chain that would be moved."""
-        if piece.ptype in [Ptype.WALL, Ptype.EMPTY]:
+    def build_move(self, piece: Point, dir: Direction) -> list[Point]:
+        """Builds a move chain for the piece on the given cell in a given direction. Returns all cells in the chain that would be moved, in order of execution."""
+        if self.grid[piece] in (Ptype.WALL.value, Ptype.EMPTY.value):
             return [] #cannot move, thus return empty list
         
-        target: Cell = self.cells[piece.y + dir.dy][piece.x + dir.dx]
-        if target.ptype == Ptype.WALL:
-            return [] #hitting a wall breaks the chain, thus return empty list
-        
-        if target == piece.other_half: # edge case (moving onto own other half)
-            moving.append(piece) # incl. self
-            return self.build_move(piece.other_half, dir, moving) # and return move chain of other half
-        
-        moving_target, moving_other = [], []
-        if target.ptype == Ptype.BOX:
-            moving_target.extend(self.build_move(target, dir, [])) #get chain of target...
-            moving_other.extend(self.build_move(target.other_half, dir, [])) #...and it's other_half
-            if not (moving_target and moving_other):
-                return [] #both need to be able to move or the entire chain is broken
-        
-        #if target.ptype == Ptype.EMPTY or BOX moved succefully
-
-        moving_twin = []
-        moving.append(piece)
-        antitarget: Cell = self.cells[piece.y - dir.dy][piece.x - dir.dx]
-        if (piece.ptype == Ptype.BOX and 
-            piece != antitarget.other_half and  # break out of circular ref if i'm moving away (i.e. being pushed) from my own other_half
-            piece.other_half not in moving # break out of circular ref if my other half is already in the moving list
-        ):
-            moving_twin.extend(self.build_move(piece.other_half, dir, moving)) #get move chain for own other_half
-            if not (moving_twin):
-                return [] #break the chain if my other half cant move
-            
-        # build the chain in proper order of execution
-        move_order = []
-        for cell in moving_twin:
-            if cell not in move_order: move_order.append(cell)
-        for cell in moving:
-            if cell not in move_order: move_order.append(cell)
-        for cell in moving_target:
-            if cell not in move_order: move_order.append(cell)
-        for cell in moving_other:
-            if cell not in move_order: move_order.append(cell)
+        moving = [piece]
+        seen = {piece}
+        for cell in moving: # grows while we iterate, i.e. breadth first
+            target = cell.step(dir.dx, dir.dy)
+            char = self.grid[target]
+            if char == Ptype.WALL.value:
+                return [] #hitting a wall breaks the chain, thus return empty list
+            if char in (Ptype.BOX_LEFT.value, Ptype.BOX_RIGHT.value):
+                pushed = [target]
+                if dir.dy: # pushing a box up or down pushes its other half as well
+                    pushed.append(target.step(1 if char == Ptype.BOX_LEFT.value else -1, 0))
+                for p in pushed:
+                    if p not in seen:
+                        seen.add(p)
+                        moving.append(p)
 
-        if dir in {Direction.UP, Direction.DOWN}:
-            return sorted(move_order, key=lambda cell: cell.y, reverse=(dir==Direction.DOWN))
-        else:
-            return sorted(move_order, key=lambda cell: cell.x, reverse=(dir==Direction.RIGHT))
+        # the furthest pieces have to move first to make room
+        return moving[::-1]
     
-    def move_piece(self, piece: Cell, dir: Direction):
+    def move_piece(self, piece: Point, dir: Direction):
         """Moves piece on the given cell in a given direction and cascades to other movable objects on the path."""
-        execution_order = self.build_move(piece, dir, [])
+        execution_order = self.build_move(piece, dir)
         for piece in execution_order:
-            target: Cell = self.cells[piece.y + dir.dy][piece.x + dir.dx]
-            if target.ptype != Ptype.EMPTY or target.other_half:
+            target = piece.step(dir.dx, dir.dy)
+            if self.grid[target] != Ptype.EMPTY.value:
                 raise ValueError('Tried to move onto a non empty cell!', piece, target)
-            target.ptype = piece.ptype
-            if target.ptype == Ptype.BOX:
-                target.other_half = piece.other_half
-                target.other_half.other_half = target # updating ref to self... that's what i get for using Cell instead of Piece objects...
-                piece.other_half = None
-            piece.ptype = Ptype.EMPTY
-            if target.ptype == Ptype.ROBOT: 
-                self.robot = target          
+            self.grid[target] = self.grid[piece]
+            self.grid[piece] = Ptype.EMPTY.value
+            if self.grid[target] == Ptype.ROBOT.value: 
+                self.robot = target
     
     def parse_moves_config(self, moves_data: str) -> list[Direction]:
         moves: list[Direction] = []   
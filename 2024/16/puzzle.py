@@ -1,9 +1,9 @@
-from typing import Iterator, Optional
-from collections import Counter
+from typing import Iterator
 from enum import Enum
-from dataclasses import dataclass, field
-import numpy as np
-from tqdm import tqdm
+from aoc.grid import Grid, Point
+from aoc import lazy, metrics
+
+np = lazy.module("numpy")
 
 class Direction(Enum):
     UP = ('^', 0, -1)
@@ -48,6 +48,12 @@ class Direction(Enum):
         current_index = directions.index(self)
         return directions[(current_index + 2) % 4]
 
+    @property
+    def index(self) -> int:
+        return DIRECTION_INDEX[self]
+
+DIRECTION_INDEX = {dir: i for i, dir in enumerate(Direction)}
+
 class Ptype(Enum):
     WALL  = '#'
     EMPTY = '.'
@@ -56,32 +62,18 @@ class Ptype(Enum):
     def __str__(self):
         return self.value
 
-@dataclass
-class Cell:
-    x: int
-    y: int
-    ptype: Ptype #transient
-    visits: Counter = field(default_factory=Counter)
-
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __eq__(self, other):
-        if isinstance(other, Cell):
-            return (self.x, self.y) == (other.x, other.y)
-        return False
-    
-    def __str__(self):
-        return str(self.ptype)
-
 class Player:
-    def __init__(self, pos: Cell, dir: Direction):
+    def __init__(self, pos: Point, dir: Direction, visits: 'np.ndarray'):
         self.pos = pos
         self.dir = dir
-        self.moves: dict[Cell, dict] = {pos: {'dir': dir, 'score': 0}} #value = dict of dir and score
-        self.pos.visits[dir] += 1
+        self.visits = visits # of the Map
+        self.moves: dict[Point, dict] = {pos: {'dir': dir, 'score': 0}} #value = dict of dir and score
+        self.visit(pos, dir)
+
+    def visit(self, target: Point, dir: Direction):
+        self.visits[target.y, target.x, dir.index] += 1
     
-    def add_move(self, target: Cell, dir: Direction, highscore = float('inf')) -> int:
+    def add_move(self, target: Point, dir: Direction, highscore = float('inf')) -> int:
         """ Scores and registers a move. Handles revison. Returns the score. """
         # edge case: if we are revisiting the same cell, let's cut back in time and assume we have walked the other way instead
         if target in self.moves:
@@ -92,7 +84,7 @@ class Player:
                     break
             self.moves = new_moves
             self.pos = target
-            self.pos.visits[dir] += 1
+            self.visit(target, dir)
             self.dir = dir
             last_move = next(reversed(self.moves.values()))
             return last_move['score']
@@ -103,37 +95,28 @@ class Player:
         if score <= highscore: #move
             self.moves[target] = {'dir': dir, 'score': score}
             self.pos = target
-            self.pos.visits[dir] += 1
+            self.visit(target, dir)
             self.dir = dir
         else: # make it so much more expensive for the next ranking
-            target.visits[dir] += 1 # 1000?
+            self.visit(target, dir) # 1000?
         return score
 
 class Map:
     def __init__(self, map_data: str):
-        lines = map_data.strip().split('\n')
-        self.height = len(lines)
-        self.width = len(lines[0]) if self.height > 0 else 0
-        self.cells = np.empty((self.height, self.width), dtype=Cell)
-        self.start: Cell
+        self.grid = Grid.from_string(map_data)
+        self.height = self.grid.height
+        self.width = self.grid.width
+        self.start: Point = self.grid.find_one('S')
+        self.grid[self.start] = Ptype.EMPTY.value
+        self.visits = np.zeros((self.height, self.width, len(Direction)), dtype=np.int64) # per cell & direction
         self.player: Player
-        self.highscores: dict[tuple[Cell, Direction], int] = {}
-        self.runs: list[dict[Cell, dict]] = [] # list[player.moves]
-        # Parse the input and populate the grid 
-        for y, line in enumerate(lines):
-            for x, char in enumerate(line):
-                if char == "S":
-                    c = Cell(x, y, Ptype.EMPTY)
-                    self.start = c
-                else:
-                    ptype = Ptype(char)
-                    c = Cell(x, y, ptype)
-                self.cells[y][x] = c
+        self.highscores: dict[tuple[Point, Direction], int] = {}
+        self.runs: list[dict[Point, dict]] = [] # list[player.moves]
 
     def do(self, n=1, best_score=0):
-        for _ in tqdm(range(n), desc="Simulating runs...", unit="run"):
-            self.player = Player(self.start, Direction.RIGHT)
-            while self.player.pos.ptype != Ptype.GOAL:
+        for _ in metrics.progress(range(n), "Simulating runs...", unit="run"):
+            self.player = Player(self.start, Direction.RIGHT, self.visits)
+            while self.grid[self.player.pos] != Ptype.GOAL.value:
                 final_score = self.move()
             if final_score == best_score or best_score==0:
                 self.runs.append(self.player.moves)
@@ -141,19 +124,19 @@ class Map:
     def checksum(self) -> int:
         return next(reversed(self.player.moves.values())).get('score', 0)
     
-    def get_best_path_cells(self) -> set[Cell]:
+    def get_best_path_cells(self) -> set[Point]:
         best_path_cells = set()
         for moves in self.runs:
             best_path_cells.update(moves.keys())
         return best_path_cells
 
-    def get_ranked_dirs(self, pos: Cell) -> list[Direction]:
+    def get_ranked_dirs(self, pos: Point) -> list[Direction]:
         """ Returns a list of walkable directions sorted by number of visits of the target cell. """
         walkable_targets = []
         for dir in list(Direction):
-            target: Cell = self.cells[pos.y + dir.dy][pos.x + dir.dx]
-            if target.ptype != Ptype.WALL:
-                walkable_targets.append((target.visits[dir], dir)) 
+            target = pos.step(dir.dx, dir.dy)
+            if self.grid[target] != Ptype.WALL.value:
+                walkable_targets.append((self.visits[target.y, target.x, dir.index], dir)) 
         ranked_targets = sorted(walkable_targets, key=lambda item: (item[0], item[1].symbol)) # i.e. sorted by visits
         return [dir for visits, dir in ranked_targets]
     
@@ -162,10 +145,11 @@ class Map:
         pos = self.player.pos
 
         ranked_dir = self.get_ranked_dirs(pos)
-        straight_target: Cell = self.cells[pos.y + self.player.dir.dy][pos.x + self.player.dir.dx]
-        nextbest_target: Cell = self.cells[pos.y + ranked_dir[0].dy][pos.x + ranked_dir[0].dx]
+        straight_target = pos.step(self.player.dir.dx, self.player.dir.dy)
+        nextbest_target = pos.step(ranked_dir[0].dx, ranked_dir[0].dy)
         if (self.player.dir in ranked_dir # i.e. is walkable
-            and straight_target.visits[self.player.dir] <= nextbest_target.visits[ranked_dir[0]] #+1000 or smth like that? bc it's 1000 more expensive to turn
+            and self.visits[straight_target.y, straight_target.x, self.player.dir.index]
+                <= self.visits[nextbest_target.y, nextbest_target.x, ranked_dir[0].index] #+1000 or smth like that? bc it's 1000 more expensive to turn
             ):
             target = straight_target
             dir = self.player.dir
@@ -180,7 +164,7 @@ class Map:
         return score
 
     def __str__(self) -> str:
-        str_grid = self.cells.astype(str)
+        str_grid = self.grid.cells.view('S1').astype(str)
         # overwrite with player path
         for cell, move in self.player.moves.items():
             str_grid[cell.y][cell.x] = str(move['dir'])
@@ -188,10 +172,11 @@ class Map:
         # Join each row into a single string, then join rows with newlines
         return '\n'.join(''.join(row) for row in str_grid)+'\nScore: '+last_score
 
-    def get_cells(self) -> Iterator[Cell]:
+    def get_cells(self) -> Iterator[Point]:
         """Returns an iterator over all cells in the map, row by row, left to right."""
-        for row in self.cells:
-            yield from row
+        for y in range(self.height):
+            for x in range(self.width):
+                yield Point(x, y)
 
 def load_puzzle(map_file: str) -> Map:
     with open(map_file, 'r') as file:
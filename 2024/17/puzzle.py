@@ -1,6 +1,6 @@
-from multiprocessing import Pool, cpu_count
+from itertools import count
 from enum import Enum
-from tqdm import tqdm
+from aoc import metrics
 
 class Instruction(Enum):
     adv = (0)
@@ -52,13 +52,12 @@ class ChronospatialPC:
     
     def fixRegA(self, start=0) -> int:
         in_regA = start
-        pbar = tqdm(desc=f"Searching Value for Registry A starting at {start}... Tested", unit="values", )
+        candidates = metrics.progress(count(start + 1), f"Searching Value for Registry A starting at {start}... Tested", unit="values")
         while self.output != self.program:
-            in_regA += 1
+            in_regA = next(candidates)
             self.output.clear()
             self.regA = in_regA
             self.do_copy_program()
-            pbar.update(1)
         return in_regA
 
     def execute(self, instruction: Instruction, operand: int):
@@ -130,37 +129,47 @@ def search_range_for_regA(args: tuple[int, int, list[int]]) -> int | None:
             return regA
     return None
 
-def parallel_search_for_regA(program: list[int], start: int = 0, chunk_size: int = 5_000_000) -> int | None:
+def parallel_search_for_regA(program: list[int], start: int = 0, chunk_size: int = 5_000_000) -> int:
     """
-    Search for regA values that produce a copy of the proogram in parallel using multiple processes.
+    Search for regA values that produce a copy of the proogram in parallel, on the shared worker pool.
     Args:
         program: The program to reproduce
         start: Starting value for regA
         chunk_size: Size of chunks to distribute to processes
     Returns:
-        The working regA value if found, None otherwise
+        The lowest working regA value
     """
-    num_processes = cpu_count()
+    from aoc import workers
+    num_processes = workers.size()
     
     # Create ranges for each process
     current = start
-    with Pool(num_processes) as pool:
-        pbar = tqdm(desc=f"Searching with {num_processes} processes", unit="chunks")
+    while True:
+        # Create chunks for each process
+        ranges = [
+            (current + i * chunk_size, current + (i + 1) * chunk_size, program)
+            for i in range(num_processes)
+        ]
+        
+        # Process chunks in parallel, the whole round so we return the lowest value found
+        # (the workers are shared, so we cannot just terminate them once one has found a value)
+        found = [result for result in workers.map(search_range_for_regA, ranges) if result is not None]
+        if found:
+            return min(found)
         
-        while True:
-            # Create chunks for each process
-            ranges = [
-                (current + i * chunk_size, current + (i + 1) * chunk_size, program)
-                for i in range(num_processes)
-            ]
-            
-            # Process chunks in parallel
-            for result in pool.imap_unordered(search_range_for_regA, ranges):
-                if result is not None:
-                    # Solution found
-                    pool.terminate()  # Stop all other processes
-                    return result
-            
-            # Update progress and move to next range
-            current += chunk_size * num_processes
-            pbar.update(num_processes)
\ No newline at end of file
+        # Update progress and move to next range
+        current += chunk_size * num_processes
+        metrics.count(f"Searched chunks of {chunk_size}", num_processes)
+
+def load_puzzle(input_file: str) -> ChronospatialPC:
+    """Load the ChronospatialPC (registers & program) from input file (path)."""
+    registers: dict[str, int] = {}
+    program: list[int] = []
+    with open(input_file, 'r') as file:
+        for line in file:
+            if line.startswith('Register'):
+                name, value = line[len('Register '):].split(':')
+                registers[name] = int(value)
+            elif line.startswith('Program'):
+                program = list(map(int, line.split(':')[1].strip().split(',')))
+    return ChronospatialPC(program, registers['A'], registers['B'], registers['C'])
@@ -1,9 +1,6 @@
 from enum import Enum
-from dataclasses import dataclass
-import numpy as np
-from tqdm import tqdm
-import networkx as nx
-import matplotlib.pyplot as plt
+from aoc.grid import Grid, Point
+from aoc import metrics
 
 class Ptype(Enum):
     WALL  = '#'
@@ -13,60 +10,45 @@ class Ptype(Enum):
     def __str__(self):
         return self.value
 
-@dataclass
-class Cell:
-    x: int
-    y: int
-    ptype: Ptype #transient
-
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __eq__(self, other):
-        if isinstance(other, Cell):
-            return (self.x, self.y) == (other.x, other.y)
-        return False
-    
-    def __str__(self):
-        return str(self.ptype)
-    
-    def to_node(self):
-        return (self.y, self.x)
+def to_node(cell: Point) -> tuple[int, int]:
+    return (cell.y, cell.x)
 
 class Map:
     def __init__(self, byte_list: list[tuple[int, int]], falling_bytes: int, map_size: int):
-        self.cells = np.array([
-            [Cell(x, y, Ptype.EMPTY) for x in range(map_size)]
-            for y in range(map_size)
-        ], dtype=object)
+        self.grid = Grid.full(map_size, map_size, Ptype.EMPTY.value)
         self.doomed = byte_list[falling_bytes:]
         self.corrupted = byte_list[:falling_bytes]
-        self.start: Cell = self.cells[0][0]
-        self.goal: Cell = self.cells[map_size-1][map_size-1]
+        self.start = Point(0, 0)
+        self.goal = Point(map_size-1, map_size-1)
         
+        import networkx as nx
         self.graph = nx.grid_2d_graph(map_size, map_size)
         for x, y in self.corrupted: #or just in byte_list[:falling_bytes] and remove self.corrupted
-            self.cells[y][x].ptype = Ptype.WALL
+            self.grid[x, y] = Ptype.WALL.value
             self.graph.remove_node((y, x))
 
     def find_critical_corruption(self) -> tuple[int, int]:
         """ Drops another byte until the critical path from start to goal is broken. Returns the byte that caused the critical corruption. """
+        import networkx as nx
         #articulation_points = list(nx.articulation_points(self.graph)) # all nodes that would disconnect the graph if removed
-        for byte in tqdm(self.doomed, desc="Finding critical corruption...:", unit="byte"):
+        for byte in metrics.progress(self.doomed, "Finding critical corruption...:", unit="byte"):
             x, y = byte
-            self.cells[y][x].ptype = Ptype.WALL
+            self.grid[x, y] = Ptype.WALL.value
             self.graph.remove_node((y, x))
-            if not nx.has_path(self.graph, self.start.to_node(), self.goal.to_node()):
+            if not nx.has_path(self.graph, to_node(self.start), to_node(self.goal)):
                 return (x, y)
 
     def do(self):
-        self.shortest_path = nx.shortest_path(self.graph, self.start.to_node(), self.goal.to_node())
+        import networkx as nx
+        self.shortest_path = nx.shortest_path(self.graph, to_node(self.start), to_node(self.goal))
 
     def checksum(self) -> int:
         return len(self.shortest_path)-1
     
     def viz(self, title="Grid Cell Connections"):
         """ Draws a plot of the graph. """
+        import networkx as nx
+        import matplotlib.pyplot as plt # optional, only needed for the plot
         plt.figure(figsize=(15, 15))
         
         # Get positions for plotting
@@ -79,8 +61,8 @@ class Map:
         node_colors = ['lightblue' for _ in self.graph.nodes()]
         
         # Highlight start and end nodes
-        start_idx = list(self.graph.nodes()).index(self.start.to_node())
-        end_idx = list(self.graph.nodes()).index(self.goal.to_node())
+        start_idx = list(self.graph.nodes()).index(to_node(self.start))
+        end_idx = list(self.graph.nodes()).index(to_node(self.goal))
         node_colors[start_idx] = 'green'
         node_colors[end_idx] = 'red'
         
@@ -89,7 +71,7 @@ class Map:
                             node_size=20)
         
         nx.draw_networkx_labels(self.graph, pos, 
-                            {self.start.to_node(): 'Start', self.goal.to_node(): 'End'},
+                            {to_node(self.start): 'Start', to_node(self.goal): 'End'},
                             font_size=12)
         
         # Plot
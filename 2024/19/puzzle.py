@@ -1,5 +1,5 @@
 from enum import Enum
-from tqdm import tqdm
+from aoc import metrics
 
 class Color(Enum):
     WHITE = "w"
@@ -190,7 +190,7 @@ class Puzzle:
         Reduces the set of towels by removing those that can be made from combinations of others.
         i.e. splits the "available_towels" into "building_towels" which can be used to form "redundant_towels"
         """
-        for towel in tqdm(self.available_towels, desc="Reducing available towels", unit="towel"):
+        for towel in metrics.progress(self.available_towels, "Reducing available towels", unit="towel"):
             candidates = towel.find_composites(self.available_towels)
             candidates.remove(towel) # ignore self
             if towel.can_be_made_of(candidates):
@@ -200,7 +200,7 @@ class Puzzle:
 
     def map_reduced_towels(self):
         """ Creates a mapping between building_towels and redundant_towels. """
-        for towel in tqdm(self.redundant_towels, desc="Mapping reduced towels", unit="towel"):
+        for towel in metrics.progress(self.redundant_towels, "Mapping reduced towels", unit="towel"):
             combos = towel.get_all_ways_to_make(self.building_towels)
             self.redundant_to_building[towel] = combos
             for possibility in combos:
@@ -233,25 +233,24 @@ class Puzzle:
     
     def do(self):
         # Part 1
-        for design in tqdm(self.desired_designs, desc=f"Recreating desings using {len(self.available_towels)} available towels", unit="design"):
+        for design in metrics.progress(self.desired_designs, f"Recreating desings using {len(self.available_towels)} available towels", unit="design"):
             if design.can_be_made_of(self.available_towels):
                 self.possible_designs.append(design)
         # Part 2
         candidates: list[Pattern] = []
         self.reduce_towels()
         self.map_reduced_towels()
-        with tqdm(self.possible_designs, desc=f"Compiling all possible combinations to recreate designs using {len(candidates)} applicable towels", unit="design") as pbar:
-            for design in pbar:
-                candidates.extend(design.find_composites(self.building_towels))
-                pbar.set_description(f"Compiling all possible combinations to recreate designs using {len(candidates)} applicable towels")
-                combos = design.get_all_ways_to_make(candidates)
-                for possibility in combos:
-                    extras = self.expand_towels(possibility)
-                    # combos.extend(extras) #combos.extend(x for x in extras if x not in combos)
-                    for extra in extras:
-                        if extra not in combos: combos.append(extra)
-                self.design_combos[design] = combos
-                candidates.clear()
+        for design in metrics.progress(self.possible_designs, "Compiling all possible combinations to recreate designs", unit="design"):
+            candidates.extend(design.find_composites(self.building_towels))
+            metrics.count("Applicable towels", len(candidates))
+            combos = design.get_all_ways_to_make(candidates)
+            for possibility in combos:
+                extras = self.expand_towels(possibility)
+                # combos.extend(extras) #combos.extend(x for x in extras if x not in combos)
+                for extra in extras:
+                    if extra not in combos: combos.append(extra)
+            self.design_combos[design] = combos
+            candidates.clear()
 
     def checksum(self) -> int:
         return len(self.possible_designs)
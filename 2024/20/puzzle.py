@@ -1,9 +1,9 @@
 from enum import Enum
 from dataclasses import dataclass
-from multiprocessing import Pool, cpu_count
-from tqdm import tqdm
-import numpy as np
-import networkx as nx
+from aoc.grid import Grid, Point
+from aoc import lazy, metrics
+
+np = lazy.module("numpy")
 
 class Direction(Enum):
     UP = ('^', 0, -1)
@@ -36,63 +36,33 @@ class Ptype(Enum):
     def __repr__(self):
         return self.value
 
-@dataclass
-class Cell:
-    x: int
-    y: int
-    ptype: Ptype #transient
-
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __eq__(self, other):
-        if isinstance(other, Cell):
-            return (self.x, self.y) == (other.x, other.y)
-        return False
-    
-    def __str__(self):
-        return str(self.ptype)
-    
-    def to_node(self):
-        return (self.y, self.x)
-    
-    def distance(self, other: 'Cell') -> int:
-        return abs(self.x - other.x) + abs(self.y - other.y)
-
 class Map:
     def __init__(self, map_data: str):
-        lines = map_data.strip().split('\n')
-        self.height = len(lines)
-        self.width = len(lines[0]) if self.height > 0 else 0
-        self.cells = np.empty((self.height, self.width), dtype=Cell)
-        self.start: Cell
-        self.goal: Cell
-        self.track: list[Cell] = []
-        # Parse the input and populate the grid 
-        for y, line in enumerate(lines):
-            for x, char in enumerate(line):
-                if char == "S":
-                    c = Cell(x, y, Ptype.EMPTY)
-                    self.start = c
-                elif char == "E":
-                    c = Cell(x, y, Ptype.EMPTY)
-                    self.goal = c
-                else:
-                    ptype = Ptype(char)
-                    c = Cell(x, y, ptype)
-                self.cells[y][x] = c
+        self.grid = Grid.from_string(map_data)
+        self.height = self.grid.height
+        self.width = self.grid.width
+        self.start = self.grid.find_one('S')
+        self.goal = self.grid.find_one('E')
+        self.grid[self.start] = Ptype.EMPTY.value
+        self.grid[self.goal] = Ptype.EMPTY.value
+        self.track: list[Point] = []
+        self.steps = np.full((self.height, self.width), -1, dtype=np.int64) # index of each cell in the track, -1 if not on it
         self._build_track()
 
-    def get_cell(self, x: int, y: int) -> Cell | None:
-        if 0 <= x < self.width and 0 <= y < self.height:
-            return self.cells[y][x]
+    def get_cell(self, x: int, y: int) -> Point | None:
+        if self.grid.in_bounds(x, y):
+            return Point(x, y)
         return None
+
+    def get_steps(self, c: Point) -> int:
+        """ Returns the number of steps from the start to the cell on the track, or -1 if it is not on the track. """
+        return int(self.steps[c.y, c.x])
     
-    def get_radius(self, c: Cell, r: int) -> list[Cell]:
+    def get_radius(self, c: Point, r: int) -> list[Point]:
         """ Returns a list of cells that are r steps away. """
         return self._get_radius(c.x, c.y, r)
 
-    def _get_radius(self, x: int, y: int, r: int) -> list[Cell]:
+    def _get_radius(self, x: int, y: int, r: int) -> list[Point]:
         """ Returns a list of cells that are r steps away. """
         radius = []
         for i in range(-r, r+1):
@@ -103,23 +73,25 @@ class Map:
                         radius.append(cell)
         return radius
     
+    def _add_to_track(self, pos: Point):
+        self.steps[pos.y, pos.x] = len(self.track)
+        self.track.append(pos)
+
     def _build_track(self):
         pos = self.start
-        pbar = tqdm(desc="Building track...", unit="step")
         while pos != self.goal:
-            pbar.update(1)
-            self.track.append(pos)
+            self._add_to_track(pos)
             for dir in list(Direction):
-                target: Cell = self.cells[pos.y + dir.dy][pos.x + dir.dx] # the map is walled of, so no need for bounds checking
-                if target.ptype == Ptype.EMPTY and target not in self.track:
+                target = pos.step(dir.dx, dir.dy) # the map is walled of, so no need for bounds checking
+                if self.grid[target] == Ptype.EMPTY.value and self.get_steps(target) < 0:
                     pos = target
                     break
-        self.track.append(self.goal)
+        self._add_to_track(self.goal)
 
 @dataclass
 class Cheat:
-    start: Cell
-    end: Cell
+    start: Point
+    end: Point
     advantage: int # number of steps saved
 
     def __hash__(self):
@@ -130,22 +102,23 @@ class Puzzle:
         self.map = m
         self.cheats: set[Cheat] = set()
 
-    def _find_cheats(self, chunk_data: tuple[list[Cell], int, int]) -> set[Cheat]:
+    def _find_cheats(self, chunk_data: tuple[list[Point], int, int]) -> set[Cheat]:
         """Process a chunk of track cells to find cheats."""
         chunk, min_advantage, radius = chunk_data
         local_cheats = set()
         for pos in chunk:
             for target in self.map.get_radius(pos, radius):
-                if target in self.map.track and target.ptype == Ptype.EMPTY:
-                    advantage = self.map.track.index(target) - self.map.track.index(pos) - pos.distance(target)
+                if self.map.get_steps(target) >= 0: # i.e. on the track
+                    advantage = self.map.get_steps(target) - self.map.get_steps(pos) - pos.distance(target)
                     if advantage >= min_advantage:
                         local_cheats.add(Cheat(pos, target, advantage))
         return local_cheats
 
     def find_cheats(self, min_advantage=2, radius=2) -> list[Cheat]:
         """Finds all possible wallhacks with a specified maximum radius which provide a specified minimum advantage."""
+        from aoc import workers
         self.cheats.clear()
-        num_processes = cpu_count()
+        num_processes = workers.size()
         track_slice = self.map.track[:-min_advantage+1]  # we can skip the last few since they won't be able to achieve the desired advantage even if it cuts right into a straight path to the goal
         
         # Create chunks of roughly equal size
@@ -155,14 +128,13 @@ class Puzzle:
         # Prepare data for parallel processing
         chunk_data = [(chunk, min_advantage, radius) for chunk in chunks]
         
-        # Process chunks in parallel
-        with Pool(processes=num_processes) as pool:
-            results = list(tqdm(
-                pool.imap(self._find_cheats, chunk_data),
-                total=len(chunks),
-                desc="Finding cheats for a good chunk of the track",
-                unit="chunk"
-            ))
+        # Process chunks in parallel, on the shared worker pool
+        results = list(metrics.progress(
+            workers.map(self._find_cheats, chunk_data),
+            "Finding cheats for a good chunk of the track",
+            unit="chunk",
+            total=len(chunks)
+        ))
         
         # Combine results
         for result in results:
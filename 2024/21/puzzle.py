@@ -1,8 +1,6 @@
 from enum import Enum
 from dataclasses import dataclass
-from tqdm import tqdm
-import networkx as nx
-from itertools import product
+from aoc import metrics
 
 class Direction(Enum):
     UP = ('^', 0, -1)
@@ -74,12 +72,14 @@ class Keypad:
     def __init__(self, buttons: list[Button], dpad: 'Keypad' = None):
         self.buttons = buttons
         self.dpad = dpad  # Reference to D-pad layout for cost calculation
+        import networkx as nx
         self.graph = nx.Graph()
         self.graph.add_nodes_from(self.buttons)
         for b1 in self.buttons:
             for b2 in self.buttons:
                 if b1 != b2 and b1.distance(b2) == 1:
                     self.graph.add_edge(b1, b2)
+        self._directions: dict[str, str] = {}
 
     def button_from_char(self, char: str) -> Button:
         #TODO: raise ValueError instead if char not in buttons
@@ -98,50 +98,26 @@ class Keypad:
         # Calculate actual distance on D-pad
         return btn1.distance(btn2)
 
-    def shortest_paths_for_pin(self, pin: str) -> list[list[list[Button]]]:
-        """ Gives all options of shortest path for a pin (series of Buttons as str), grouped by Button in separat lists. 
-        Returns: Nested list of lists of lists of Button objects
-        1. Level: Equally short options of the entire path
-        2. Level: Path for the entire Pin
-        3. Level: Path from one Button to the next
-        """
-        options: list[list[list[Button]]] = []
-        for start, goal in zip(pin, pin[1:]):
-            start = self.button_from_char(start)
-            goal = self.button_from_char(goal)
-            paths = list(nx.all_shortest_paths(self.graph, start, goal))
-            options.append(paths)
-        options = list(product(*options))
-        return options
-    
+    def moves(self, start: str, goal: str) -> list[str]:
+        """ All shortest ways from one Button to another, as directions followed by the press of "A", sorted. """
+        import networkx as nx
+        paths = nx.all_shortest_paths(self.graph, self.button_from_char(start), self.button_from_char(goal))
+        return sorted(''.join(Direction.from_buttons(a, b).symbol for a, b in zip(path, path[1:])) + "A" for path in paths)
+
     def directions_for_pin(self, pin: str) -> str:
-        """ Gives the directions for a pin (series of Buttons as str), separated by "A" for Button-presses. """
-        paths = self.shortest_paths_for_pin(pin)
-        options = set()
-        for option in paths:
+        """
+        Shortest series of presses on the last Keypad of the chain (see dpad) which types the pin on this one.
+        Every move between two Buttons starts and ends with the next Keypad on "A", so each move is picked on its
+        own, by what it costs through the whole chain rather than on the next Keypad alone. Of equally short
+        ones, the first in order, so the result never depends on the order of a set.
+        """
+        if pin not in self._directions:
             directions = ""
-            for button_path in option:
-                for start, goal in zip(button_path, button_path[1:]):
-                    dx, dy = start.delta(goal)
-                    directions += (Direction.from_delta(dx, dy).symbol)
-                directions += "A"
-            options.add(directions)
-        return self.fastest_option(options)
-    
-    def cost_of_directions(self, directions: str) -> int:
-        """ Returns the cost of a series of directions. """
-        cost = 0
-        if not self.dpad:
-            return len(directions)
-        for start, goal in zip('A'+directions, directions):
-            cost += self.dpad.button_from_char(start).distance(self.dpad.button_from_char(goal))
-        #for start, goal in zip(directions, directions[1:]):
-        #    cost += self.dpad.button_from_char(start).distance(self.dpad.button_from_char(goal))
-        return cost
-    
-    def fastest_option(self, options: set[str]) -> str:
-        """ Returns the fastest option of a list of directions. """
-        return min(options, key=lambda x: self.cost_of_directions(x))
+            for start, goal in zip("A"+pin, pin):
+                expanded = [self.dpad.directions_for_pin(m) if self.dpad else m for m in self.moves(start, goal)]
+                directions += min(expanded, key=len)
+            self._directions[pin] = directions
+        return self._directions[pin]
 
 class Puzzle:
     def __init__(self, data):
@@ -177,11 +153,8 @@ class Puzzle:
         return int(num_part)
     
     def do(self):
-        for pin in tqdm(self.pincodes, desc="Deriving Instructions for Pins...", unit="pin"):
-            dir_t1 = self.numpad.directions_for_pin("A"+pin)
-            dir_t2 = self.dirpad_t1.directions_for_pin("A"+dir_t1)
-            dir_t3 = self.dirpad_t2.directions_for_pin("A"+dir_t2)
-            self.instructions.append(dir_t3)
+        for pin in metrics.progress(self.pincodes, "Deriving Instructions for Pins...", unit="pin"):
+            self.instructions.append(self.numpad.directions_for_pin(pin))
 
     def checksum(self):
         r = 0
@@ -1,5 +1,7 @@
-from tqdm import tqdm
-import pandas as pd
+from typing import TYPE_CHECKING
+from aoc import metrics
+if TYPE_CHECKING:
+    import pandas as pd # imported when needed, part 1 does without it
 
 class Puzzle:
     def __init__(self, secrets: list[int]):
@@ -27,7 +29,7 @@ class Puzzle:
         return secret % 10
     
     def gen_sequences(self, n=2000):
-        for secret in tqdm(self.secrets, desc="Computing sequences", unit="secret"):
+        for secret in metrics.progress(self.secrets, "Computing sequences", unit="secret"):
             sequences: list[tuple[int,int,int,list[int]]] = [] # (secret, price, change, change_seq)
             seq = secret
             change_seq = [None, None, None, None]
@@ -46,8 +48,9 @@ class Puzzle:
     def calc_top_change_seq(self):
         #TODO: could store as list[tuple[base, secret, price, change, str(change_seq)]] during gen_sequences to avoid costly pd.concat
         # but it still runs in under 1min, so, can't be bothered...
+        import pandas as pd
         df_master = pd.DataFrame(columns=["secret", "price", "change", "change_seq", "base"])
-        for base, seq in tqdm(self.sequences.items(), desc="Merging results for best price analysis", unit="monkey"):
+        for base, seq in metrics.progress(self.sequences.items(), "Merging results for best price analysis", unit="monkey"):
             df = pd.DataFrame(seq, columns=["secret", "price", "change", "change_seq"])
             df["base"] = base
             df_master = pd.concat([df_master, df])
@@ -1,8 +1,6 @@
-from tqdm import tqdm
-import networkx as nx
-
 class Puzzle:
     def __init__(self, data):
+        import networkx as nx
         self.graph = nx.Graph()
         self.lanparties = [] #list of lists of connected nodes
         for connection in data:
@@ -11,6 +9,7 @@ class Puzzle:
 
     def identify_lanparties(self, max_size: int):
         """ Stores a list of lists of inter-connected computers (i.e. every node is connected to every other node in the cluster), with a given cluster size. """
+        import networkx as nx
         self.lanparties = []
         self.matches = []
         max_size = self.graph.number_of_nodes() if max_size is None else max_size
@@ -1,5 +1,3 @@
-from tqdm import tqdm
-
 class Puzzle:
     def __init__(self, data):
         pass
@@ -0,0 +1 @@
+"""Runs and times the Advent of Code puzzles of this repo, e.g. `python -m aoc run 2024 --days 6,9,17 --part 2`."""
@@ -0,0 +1,149 @@
+import argparse
+from dataclasses import asdict
+from pathlib import Path
+
+from aoc import bench, memory, metrics, runner, schedule
+
+def parse_days(value: str) -> list[int]:
+    """Parses a comma separated list of days, incl. ranges like 1-5."""
+    days = []
+    for item in value.split(','):
+        first, _, last = item.partition('-')
+        days.extend(range(int(first), int(last or first) + 1))
+    return days
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="aoc", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="solve the quest input of each day and time its parse, solve and verify phases")
+    run.add_argument("year", type=int)
+    run.add_argument("--days", type=parse_days, help="e.g. 6,9,17 or 1-5 (default: all)")
+    run.add_argument("--part", type=int, choices=(1, 2), help="(default: both)")
+    run.add_argument("--cache", action="store_true", help="reuse the parsed inputs of earlier runs")
+    run.add_argument("--jobs", type=int, help="run the parts concurrently on this many worker processes, longest first (0: one per CPU)")
+    run.add_argument("--mem", action="store_true", help="trace the allocations of each phase, report its peak and top allocation sites (slow)")
+    run.add_argument("--progress", action="store_true", help="show progress bars of the long running loops")
+    run.add_argument("--metrics", type=Path, help="write the time of each stage and the counters to this JSON file")
+    run.add_argument("--trace", type=Path, help="write the stages and counters to this file in the Chrome trace format")
+
+    main_cmd = commands.add_parser("main", help="run the main.py of a day (its tests and prints) in its directory")
+    main_cmd.add_argument("year", type=int)
+    main_cmd.add_argument("day", type=int)
+
+    bench_cmd = commands.add_parser("bench", help="benchmark the quest input of each day and store the results as a JSON baseline")
+    bench_cmd.add_argument("year", type=int)
+    bench_cmd.add_argument("--days", type=parse_days, help="e.g. 6,9,17 or 1-5 (default: all)")
+    bench_cmd.add_argument("--part", type=int, choices=(1, 2), help="(default: both)")
+    bench_cmd.add_argument("--repeat", type=int, default=5, help="timed runs per part (default: %(default)s)")
+    bench_cmd.add_argument("--warmup", type=int, default=1, help="untimed runs per part (default: %(default)s)")
+    bench_cmd.add_argument("--cache", action="store_true", help="reuse the parsed inputs of earlier runs")
+    bench_cmd.add_argument("--out", type=Path, help="where to store the baseline (default: benchmarks/<year>.json)")
+
+    startup = commands.add_parser("startup", help="time the import of each day's puzzle module in a fresh interpreter")
+    startup.add_argument("year", type=int)
+    startup.add_argument("--days", type=parse_days, help="e.g. 6,9,17 or 1-5 (default: all)")
+    startup.add_argument("--repeat", type=int, default=3, help="imports per day, the fastest counts (default: %(default)s)")
+    startup.add_argument("--limit", type=float, default=0.1, help="seconds an import may take (default: %(default)s)")
+
+    scale_cmd = commands.add_parser("scale", help="benchmark each day on generated inputs of growing size")
+    scale_cmd.add_argument("year", type=int)
+    scale_cmd.add_argument("--days", type=parse_days, help="e.g. 6,9,17 or 1-5 (default: all with an input generator)")
+    scale_cmd.add_argument("--part", type=int, choices=(1, 2), help="(default: both)")
+    scale_cmd.add_argument("--sizes", type=parse_days, required=True, help="sizes of the inputs, e.g. 100,1000,10000 (see aoc/generate.py)")
+    scale_cmd.add_argument("--seed", type=int, default=0)
+    scale_cmd.add_argument("--repeat", type=int, default=1, help="timed runs per part and size (default: %(default)s)")
+    scale_cmd.add_argument("--warmup", type=int, default=1, help="untimed runs per part and size (default: %(default)s)")
+    scale_cmd.add_argument("--out", type=Path, help="also write the curves to this JSON file")
+
+    compare = commands.add_parser("compare", help="fail if any part regressed against a baseline")
+    compare.add_argument("baseline", type=Path)
+    compare.add_argument("current", type=Path, nargs="?", help="(default: benchmark now, with the settings of the baseline)")
+    compare.add_argument("--threshold", type=float, default=0.1, help="relative regression to tolerate (default: %(default)s)")
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        failed = False
+        parts = [args.part] if args.part else None
+        recording = args.metrics or args.trace
+        if recording and args.progress:
+            parser.error("--progress cannot be combined with --metrics or --trace")
+        if (recording or args.progress) and args.jobs is not None:
+            # the stages run in the worker processes, which report to nothing
+            parser.error("--metrics, --trace and --progress cannot be combined with --jobs")
+        sink = metrics.Recorder() if recording else metrics.Progress() if args.progress else metrics.Metrics()
+        if args.jobs is None:
+            results = runner.run(args.year, args.days, parts, args.cache, args.mem)
+        elif args.mem:
+            parser.error("--mem cannot be combined with --jobs")
+        else:
+            results = schedule.run(args.year, args.days, parts, args.cache, args.jobs or None)
+        with metrics.use(sink):
+            for result in results:
+                print(runner.format_result(result), flush=True)
+                for phase in result.phases or []:
+                    print(memory.format_phase(phase), flush=True)
+                failed = failed or result.ok is False
+        if args.metrics:
+            sink.save(args.metrics)
+        if args.trace:
+            sink.save(args.trace, chrome=True)
+        return 1 if failed else 0
+
+    if args.command == "main":
+        runner.run_main(args.year, args.day)
+        return 0
+
+    if args.command == "bench":
+        parts = [args.part] if args.part else None
+        results = {}
+        for key, stats in bench.bench(args.year, args.days, parts, args.repeat, args.warmup, args.cache):
+            print(bench.format_stats(key, stats), flush=True)
+            results[key] = stats
+        out = args.out or runner.ROOT / "benchmarks" / f"{args.year}.json"
+        bench.save_baseline(out, bench.make_baseline(args.year, results, args.repeat, args.warmup, args.cache))
+        print(f"Baseline written to {out}")
+        return 0
+
+    if args.command == "startup":
+        slow = False
+        for day in args.days or runner.discover(args.year):
+            seconds, modules = runner.import_time(args.year, day, args.repeat)
+            heaviest = ", ".join(f"{name} {module_seconds * 1000:.1f}ms" for name, module_seconds in modules[:3])
+            status = "ok" if seconds <= args.limit else "SLOW"
+            print(f"{args.year}/{day:02d}  import {runner.format_seconds(seconds)}  {status:4}  {heaviest}", flush=True)
+            slow = slow or seconds > args.limit
+        return 1 if slow else 0
+
+    if args.command == "scale":
+        parts = [args.part] if args.part else None
+        curves: dict[str, list[dict]] = {}
+        for key, size, stats in bench.scale(args.year, args.days, parts, args.sizes, args.seed, args.repeat, args.warmup):
+            print(bench.format_stats(f"{key} n={size:<9}", stats), flush=True)
+            curves.setdefault(key, []).append({"n": size, **asdict(stats)})
+        if args.out:
+            bench.save_baseline(args.out, {"year": args.year, "seed": args.seed, "repeat": args.repeat, "warmup": args.warmup, "curves": curves})
+            print(f"Scaling curves written to {args.out}")
+        return 0
+
+    if args.command == "compare":
+        baseline = bench.load_baseline(args.baseline)
+        if args.current:
+            current = bench.load_baseline(args.current)
+        else:
+            keys = [key.split('/') for key in baseline["results"]]
+            results = {}
+            for year, day, part in keys:
+                for key, stats in bench.bench(int(year), [int(day)], [int(part)], baseline["repeat"], baseline["warmup"], baseline.get("cache", False)):
+                    print(bench.format_stats(key, stats), flush=True)
+                    results[key] = stats
+            current = bench.make_baseline(baseline["year"], results, baseline["repeat"], baseline["warmup"], baseline.get("cache", False))
+        regressions = bench.compare(baseline, current, args.threshold)
+        for regression in regressions:
+            print("Regression:", regression)
+        if not regressions:
+            print(f"No regressions above {args.threshold:.0%}")
+        return 1 if regressions else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
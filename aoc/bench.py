@@ -0,0 +1,168 @@
+"""Benchmarks the quest inputs of each day and gates regressions against a stored JSON baseline."""
+import json
+import math
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from multiprocessing import get_context
+from pathlib import Path
+
+from aoc import generate, runner, workers
+
+try:
+    import resource
+except ImportError: # not available on Windows
+    resource = None
+
+VERSION = 1 # of the baseline format
+
+@dataclass
+class Stats:
+    median: float  # seconds, of the total of all phases
+    p95: float
+    parse: float   # medians of the single phases
+    solve: float
+    verify: float
+    peak_rss: int | None # KiB, of the whole process (incl. the interpreter and imports)
+    ok: bool | None
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile, e.g. q=0.95"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+def peak_rss() -> int | None:
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+def bench_part(year: int, day: int, part: int, repeat: int = 5, warmup: int = 1, cache: bool = False,
+               directory: Path | None = None, load_args: tuple | None = None) -> Stats:
+    """Runs one part `warmup` + `repeat` times and aggregates the timings of the latter."""
+    results: list[runner.Result] = []
+    for n in range(warmup + repeat):
+        result = runner.run_part(year, day, part, cache, directory, load_args)
+        if n >= warmup:
+            results.append(result)
+    totals = [r.parse + r.solve + r.verify for r in results]
+    return Stats(
+        median=statistics.median(totals),
+        p95=percentile(totals, 0.95),
+        parse=statistics.median(r.parse for r in results),
+        solve=statistics.median(r.solve for r in results),
+        verify=statistics.median(r.verify for r in results),
+        peak_rss=peak_rss(),
+        ok=None if any(r.ok is None for r in results) else all(r.ok for r in results),
+    )
+
+def _bench_alone(*args) -> Stats:
+    """bench_part in a process of its own, which can only exit once the workers it might have started are gone."""
+    try:
+        return bench_part(*args)
+    finally:
+        workers.shutdown()
+
+def bench(year: int, days: list[int] | None = None, parts: list[int] | None = None, repeat: int = 5, warmup: int = 1, cache: bool = False):
+    """
+    Benchmarks the selected parts of the selected days (all by default), each in a fresh process so that
+    the peak RSS of one day does not carry over to the next.
+
+    Yields:
+        tuple[str, Stats]: the key of the part (e.g. "2024/06/2") and its statistics.
+    """
+    # spawn rather than fork, so the child's peak RSS starts from a clean interpreter
+    with ProcessPoolExecutor(1, mp_context=get_context("spawn"), max_tasks_per_child=1) as pool:
+        for day in days or runner.discover(year):
+            available = runner.get_day(year, day).parts
+            for part in parts or sorted(available):
+                if part in available:
+                    stats = pool.submit(_bench_alone, year, day, part, repeat, warmup, cache).result()
+                    yield f"{year}/{day:02d}/{part}", stats
+
+def scale(year: int, days: list[int] | None, parts: list[int] | None, sizes: list[int], seed: int = 0,
+          repeat: int = 1, warmup: int = 1):
+    """
+    Benchmarks the selected parts on generated inputs of each size (see aoc.generate), each in a fresh process.
+    Days without an input generator are skipped.
+
+    Yields:
+        tuple[str, int, Stats]: the key of the part, the size of the input and the statistics.
+    """
+    with ProcessPoolExecutor(1, mp_context=get_context("spawn"), max_tasks_per_child=1) as pool:
+        for day in days or runner.discover(year):
+            if (year, day) not in generate.GENERATORS:
+                continue
+            available = runner.get_day(year, day).parts
+            for size in sizes:
+                with tempfile.TemporaryDirectory(prefix=f"aoc{year}_{day:02d}_") as directory:
+                    generated = generate.write(year, day, size, seed, Path(directory))
+                    for part in parts or sorted(available):
+                        if part in available:
+                            stats = pool.submit(_bench_alone, year, day, part, repeat, warmup, False,
+                                                Path(directory), generated.load_args).result()
+                            yield f"{year}/{day:02d}/{part}", size, stats
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=runner.ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def make_baseline(year: int, results: dict[str, Stats], repeat: int, warmup: int, cache: bool = False) -> dict:
+    return {
+        "version": VERSION,
+        "year": year,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "commit": git_commit(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "warmup": warmup,
+        "cache": cache,
+        "results": {key: asdict(stats) for key, stats in results.items()},
+    }
+
+def save_baseline(path: Path, baseline: dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as file:
+        json.dump(baseline, file, indent=2)
+        file.write('\n')
+
+def load_baseline(path: Path) -> dict:
+    with open(path, 'r') as file:
+        baseline = json.load(file)
+    if baseline.get("version") != VERSION:
+        raise ValueError(f"Unsupported baseline version {baseline.get('version')} in {path}, expected {VERSION}")
+    return baseline
+
+def compare(baseline: dict, current: dict, threshold: float = 0.1) -> list[str]:
+    """
+    Compares the median runtime and peak RSS of every part present in both baselines.
+
+    Returns:
+        list[str]: A description of every regression by more than `threshold` (relative), empty if there is none.
+    """
+    regressions = []
+    for key, new in current["results"].items():
+        old = baseline["results"].get(key)
+        if old is None:
+            continue
+        for metric in ("median", "peak_rss"):
+            if old[metric] and new[metric] and new[metric] > old[metric] * (1 + threshold):
+                regressions.append(f"{key} {metric}: {old[metric]:.4g} -> {new[metric]:.4g} (+{new[metric] / old[metric] - 1:.0%})")
+        if old["ok"] and new["ok"] is False:
+            regressions.append(f"{key}: wrong answer")
+    return regressions
+
+def format_stats(key: str, stats: Stats) -> str:
+    rss = f"{stats.peak_rss / 1024:8.1f}MiB" if stats.peak_rss is not None else " " * 11
+    status = {True: "ok", False: "FAIL", None: "?"}[stats.ok]
+    return (f"{key}  median {runner.format_seconds(stats.median)}  p95 {runner.format_seconds(stats.p95)}"
+            f"  (parse {runner.format_seconds(stats.parse)}  solve {runner.format_seconds(stats.solve)}"
+            f"  verify {runner.format_seconds(stats.verify)})  rss {rss}  {status}")
@@ -0,0 +1,81 @@
+"""On-disk cache of parsed puzzles, keyed by the content of the input files and the source of the parsing code."""
+import hashlib
+import os
+import pickle
+import struct
+from pathlib import Path
+from typing import Any, Callable
+
+MAGIC = b"AOCPKL1\n"
+ALIGN = 64 # out-of-band buffers (i.e. NumPy arrays) start at aligned offsets
+
+def digest(files: list[Path], *extra: object) -> str:
+    """SHA-256 over the content of the files and the repr of any extra values."""
+    sha = hashlib.sha256()
+    for path in files:
+        with open(path, 'rb') as file:
+            sha.update(hashlib.file_digest(file, 'sha256').digest())
+    for value in extra:
+        sha.update(repr(value).encode())
+    return sha.hexdigest()
+
+def _aligned(offset: int) -> int:
+    return -(-offset // ALIGN) * ALIGN
+
+def dump(obj: Any, path: Path):
+    """
+    Pickles the object with protocol 5, writing large buffers (e.g. NumPy arrays) out of band,
+    so that loading them is a single read without another copy.
+
+    Layout: MAGIC, number of buffers, length of the pickle, length of each buffer,
+    the pickle and then each buffer at an aligned offset.
+    """
+    buffers: list[pickle.PickleBuffer] = []
+    data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    raws = [buffer.raw() for buffer in buffers]
+    header = MAGIC + struct.pack(f"<QQ{len(raws)}Q", len(raws), len(data), *(raw.nbytes for raw in raws))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, 'wb') as file:
+        file.write(header)
+        file.write(data)
+        for raw in raws:
+            file.write(b"\0" * (_aligned(file.tell()) - file.tell()))
+            file.write(raw)
+    os.replace(tmp, path) # never leave a half written entry behind
+
+def load(path: Path) -> Any:
+    size = path.stat().st_size
+    content = bytearray(size) # writable, as the puzzles modify their parsed state
+    with open(path, 'rb') as file:
+        file.readinto(content)
+    view = memoryview(content)
+
+    if view[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path} is not a puzzle cache entry")
+    offset = len(MAGIC)
+    n_buffers, data_len = struct.unpack_from("<QQ", content, offset)
+    offset += 16
+    lengths = struct.unpack_from(f"<{n_buffers}Q", content, offset)
+    offset += 8 * n_buffers
+
+    data = view[offset:offset + data_len]
+    offset += data_len
+    buffers = []
+    for length in lengths:
+        offset = _aligned(offset)
+        buffers.append(view[offset:offset + length])
+        offset += length
+    return pickle.loads(data, buffers=buffers)
+
+def cached(path: Path, make: Callable[[], Any]) -> Any:
+    """Loads the object from the cache entry, or makes and stores it if there is none (or it is unreadable)."""
+    if path.exists():
+        try:
+            return load(path)
+        except (OSError, ValueError, EOFError, struct.error, pickle.UnpicklingError, AttributeError):
+            pass # e.g. written by an older version of a class, let's just parse again
+    obj = make()
+    dump(obj, path)
+    return obj
@@ -0,0 +1,109 @@
+"""Registry of the days which deviate from the dd template, with the known answers of the quest inputs."""
+from aoc.runner import Day, Part
+
+def _visited_cells(m) -> set[tuple[int, int]]:
+    return {(x, y) for x, y, _ in m.simulate_guard_movement()[0]}
+
+def _looping_obstructions(m) -> int:
+    """Same as Part 2 of 2024/06/main.py"""
+    return len(m.find_loop_obstructions())
+
+def _best_path_cells(m) -> int:
+    m.do()
+    m.do(9, m.checksum())
+    return len(m.get_best_path_cells())
+
+DAYS: dict[tuple[int, int], Day] = {
+    (2024, 1): Day(inputs=("input.txt",), parts={
+        1: Part(expected=2769675),
+        2: Part(answer="check_p2", expected=24643097),
+    }),
+    (2024, 2): Day(inputs=("input.csv",), parts={
+        1: Part(expected=524),
+        2: Part(answer="check_p2", expected=569),
+    }),
+    (2024, 3): Day(inputs=("input.txt",), parts={
+        1: Part(solve="scan", expected=182619815),
+        2: Part(solve="scan", answer="check_p2", expected=80747545),
+    }),
+    (2024, 4): Day(module="wordsearch", parts={
+        1: Part(solve="count_word", answer=None, expected=2591),
+        2: Part(solve="count_x_mas", answer=None, expected=1880),
+    }),
+    (2024, 5): Day(inputs=("input/ordering_rules.csv", "input/updates.csv"), parts={
+        1: Part(expected=7198),
+        2: Part(answer="check_p2", expected=4230),
+    }),
+    (2024, 6): Day(module="map", loader="load_map", inputs=("input.txt",), parallel=True, parts={
+        1: Part(solve=lambda m: len(_visited_cells(m)), answer=None, expected=4890),
+        2: Part(solve=_looping_obstructions, answer=None, expected=1995),
+    }),
+    (2024, 7): Day(parts={
+        1: Part(expected=7710205485870),
+        2: Part(solve="check_p2", answer=None, expected=20928985450275),
+    }),
+    (2024, 8): Day(parts={
+        1: Part(solve="create_antinodes", answer=lambda g: len(g.antinodes), expected=351),
+        2: Part(solve=lambda g: g.create_antinodes(resonance=True), answer=lambda g: len(g.antinodes), expected=1259),
+    }),
+    (2024, 9): Day(parts={
+        1: Part(solve="compact", expected=6330095022244),
+        2: Part(solve="compact_files", expected=6359491814941),
+    }),
+    (2024, 10): Day(parts={
+        1: Part(solve="discover_trails", answer=lambda m: m.score, expected=629),
+        2: Part(solve="discover_trails", answer=lambda m: m.rating, expected=1242),
+    }),
+    (2024, 11): Day(parts={
+        1: Part(solve=lambda p: p.blink(25), answer="total_stones", expected=218956),
+        2: Part(solve=lambda p: p.blink(75), answer="total_stones", expected=259593838049805),
+    }),
+    (2024, 12): Day(parts={
+        # verifying it exposed a solver bug, which doubled regions of a single plot (the 1353000 before)
+        1: Part(solve="total_price", answer=None, expected=1352976),
+    }),
+    (2024, 13): Day(parts={
+        # the parser already adds the Part 2 unit conversion to the prizes
+        2: Part(solve=None, expected=101406661266314),
+    }),
+    (2024, 14): Day(load_args=(101, 103), parts={
+        1: Part(solve="tick", expected=217132650),
+    }),
+    (2024, 15): Day(inputs=("input/quest_map.txt", "input/quest_moves.txt"), parts={
+        # the map is parsed twice as wide, i.e. Part 2 only
+        2: Part(expected=1519991),
+    }),
+    (2024, 16): Day(parts={
+        1: Part(expected=127520),
+        2: Part(solve=_best_path_cells, answer=None),
+    }),
+    (2024, 17): Day(parts={
+        1: Part(expected="1,5,0,3,7,3,0,3,1"),
+        # brute forcing fixRegA does not terminate in reasonable time
+    }),
+    (2024, 18): Day(load_args=(1024, 71), parts={
+        1: Part(expected=294),
+        2: Part(solve="find_critical_corruption", answer=None, expected=(31, 22)),
+    }),
+    (2024, 19): Day(inputs=("input/quest_towels.txt", "input/quest_designs.txt"), parts={
+        # do() also compiles all combinations for Part 2
+        1: Part(solve=lambda p: sum(d.can_be_made_of(p.available_towels) for d in p.desired_designs), answer=None, expected=272),
+        2: Part(answer="check_p2"),
+    }),
+    (2024, 20): Day(parallel=True, parts={
+        1: Part(solve=lambda p: p.find_cheats(100), expected=1402),
+        2: Part(solve=lambda p: p.find_cheats(100, 20), expected=1020244),
+    }),
+    (2024, 21): Day(parts={
+        # verifying it exposed a solver which broke ties by hash order (the 130328 before was one of its results)
+        1: Part(expected=123096),
+    }),
+    (2024, 22): Day(parts={
+        1: Part(solve=lambda p: p.gen_sequences(2000), expected=14180628689),
+        2: Part(answer="check_p2", expected=1690),
+    }),
+    (2024, 23): Day(parts={
+        1: Part(solve=lambda p: p.do(max_size=3, starts_with="t"), expected=1119),
+        2: Part(solve=lambda p: p.do(starts_with="t"), answer="check_p2", expected="av,fr,gj,hk,ii,je,jo,lq,ny,qd,uq,wq,xc"),
+    }),
+}
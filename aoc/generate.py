@@ -0,0 +1,272 @@
+"""
+Generates valid, scaled up quest inputs for stress testing the days, e.g. 1M location lists for day 01
+or a 10k x 10k map for day 06. The meaning of the size `n` depends on the day (see `GENERATORS`);
+the same `n` and `seed` always give the same input.
+"""
+import math
+import string
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from aoc import lazy, runner
+
+np = lazy.module("numpy")
+
+@dataclass
+class Input:
+    files: tuple[str, ...] # content of each input file of the day, in the order of `Day.inputs`
+    load_args: tuple | None = None # replaces `Day.load_args`, where they depend on the size of the input
+
+def _chars(chars: str) -> 'np.ndarray':
+    return np.frombuffer(chars.encode(), dtype=np.uint8)
+
+def _grid(cells: 'np.ndarray') -> str:
+    """Lines of a [y, x] array of characters (as bytes)."""
+    height, width = cells.shape
+    lines = np.full((height, width + 1), ord('\n'), dtype=np.uint8)
+    lines[:, :width] = cells
+    return lines.tobytes()[:-1].decode()
+
+def _numbers(values: 'np.ndarray', sep: str = ' ') -> str:
+    return sep.join(map(str, values.tolist()))
+
+def _serpentine(n: int) -> 'np.ndarray':
+    """A single winding track of '.' from S (top left) to E, walled in by '#', n x n (n odd, at least 5)."""
+    n = max(n | 1, 5)
+    cells = np.full((n, n), ord('#'), dtype=np.uint8)
+    rows = list(range(1, n - 1, 2))
+    for k, y in enumerate(rows):
+        cells[y, 1:n - 1] = ord('.')
+        if k < len(rows) - 1:
+            cells[y + 1, n - 2 if k % 2 == 0 else 1] = ord('.')
+    cells[1, 1] = ord('S')
+    cells[rows[-1], n - 2 if len(rows) % 2 == 1 else 1] = ord('E')
+    return cells
+
+def location_lists(n: int, rng: 'np.random.Generator') -> Input:
+    """2024/01: n lines of two location IDs, half of the right ones also appear on the left."""
+    high = max(100_000, 10 * n)
+    left = rng.integers(10_000, high, n)
+    right = np.where(rng.random(n) < 0.5, rng.choice(left, n), rng.integers(10_000, high, n))
+    return Input(('\n'.join(f"{a}   {b}" for a, b in zip(left.tolist(), right.tolist())),))
+
+def reports(n: int, rng: 'np.random.Generator') -> Input:
+    """2024/02: n reports of 5 to 8 levels, half of them with one level off."""
+    lines = []
+    for length in rng.integers(5, 9, n).tolist():
+        steps = rng.integers(1, 4, length - 1) * rng.choice((-1, 1))
+        levels = np.cumsum(np.concatenate(([rng.integers(25, 75)], steps)))
+        if rng.random() < 0.5:
+            levels[rng.integers(length)] += rng.integers(-3, 4)
+        lines.append(_numbers(levels))
+    return Input(('\n'.join(lines),))
+
+def corrupted_memory(n: int, rng: 'np.random.Generator') -> Input:
+    """2024/03: n instructions (mostly mul, some do/don't and corrupted ones), separated by junk."""
+    junk = _chars("!@#$%^&*()[]{}<>+-;:'/?~ ,whyatfromselectdon")
+    a, b = rng.integers(1, 1000, n).tolist(), rng.integers(1, 1000, n).tolist()
+    kinds = rng.random(n).tolist()
+    lengths = rng.integers(0, 8, n).tolist()
+    noise = rng.choice(junk, sum(lengths)).tobytes().decode()
+    parts, offset = [], 0
+    for i in range(n):
+        parts.append(noise[offset:offset + lengths[i]])
+        offset += lengths[i]
+        if kinds[i] < 0.05:
+            parts.append("do()")
+        elif kinds[i] < 0.1:
+            parts.append("don't()")
+        elif kinds[i] < 0.8:
+            parts.append(f"mul({a[i]},{b[i]})")
+        else:
+            parts.append(("mul({},{}]", "mul( {},{})", "mul[{},{}]", "mul({} ,{})")[i % 4].format(a[i], b[i]))
+    return Input((''.join(parts),))
+
+def word_search(n: int, rng: 'np.random.Generator') -> Input:
+    """2024/04: n x n letters of XMAS."""
+    return Input((_grid(rng.choice(_chars("XMAS"), (n, n))),))
+
+def print_queue(n: int, rng: 'np.random.Generator') -> Input:
+    """
+    2024/05: n updates of 5 to 23 of 49 pages, half of them in order. Like the quest input, there is a rule
+    for every pair of pages: the pages are in a circle and each comes before the next 24, so any 25 in a row
+    (where the pages of an update are picked from) have a consistent order.
+    """
+    circle = rng.choice(np.arange(10, 100), 49, replace=False).tolist()
+    rules = [f"{circle[i]}|{circle[(i + k) % 49]}" for i in range(49) for k in range(1, 25)]
+    rng.shuffle(rules)
+    updates = []
+    for length in (2 * rng.integers(2, 12, n) + 1).tolist():
+        ranks = rng.choice(25, length, replace=False) + rng.integers(49)
+        if rng.random() < 0.5:
+            ranks.sort()
+        updates.append(','.join(str(circle[rank % 49]) for rank in ranks.tolist()))
+    return Input(('\n'.join(rules), '\n'.join(updates)))
+
+def lab_map(n: int, rng: 'np.random.Generator') -> Input:
+    """2024/06: n x n map with 1.5% obstructions and the guard facing up."""
+    cells = np.where(rng.random((n, n)) < 0.015, ord('#'), ord('.')).astype(np.uint8)
+    cells[rng.integers(n), rng.integers(n)] = ord('^')
+    return Input((_grid(cells),))
+
+def calibrations(n: int, rng: 'np.random.Generator') -> Input:
+    """2024/07: n equations of 3 to 12 operands, about half of them solvable."""
+    lines = []
+    for length in rng.integers(3, 13, n).tolist():
+        operands = rng.integers(1, 1000, length).tolist()
+        total = operands[0]
+        for operand, op in zip(operands[1:], rng.integers(0, 3, length - 1).tolist()):
+            total = total + operand if op == 0 else total * operand if op == 1 else int(f"{total}{operand}")
+        if rng.random() < 0.5:
+            total += int(rng.integers(1, 10))
+        lines.append(f"{total}: {_numbers(np.array(operands))}")
+    return Input(('\n'.join(lines),))
+
+def antenna_map(n: int, rng: 'np.random.Generator') -> Input:
+    """2024/08: n x n map with 0.16% antennas of 62 frequencies."""
+    frequencies = rng.choice(_chars(string.digits + string.ascii_letters), (n, n))
+    cells = np.where(rng.random((n, n)) < 0.0016, frequencies, ord('.')).astype(np.uint8)
+    return Input((_grid(cells),))
+
+def disk_map(n: int, rng: 'np.random.Generator') -> Input:
+    """2024/09: n digits, files of 1 to 9 blocks and free spaces of 0 to 9 blocks."""
+    digits = rng.integers(1, 10, n)
+    digits[1::2] = rng.integers(0, 10, len(digits[1::2]))
+    return Input(((digits + ord('0')).astype(np.uint8).tobytes().decode(),))
+
+def topographic_map(n: int, rng: 'np.random.Generator') -> Input:
+    """2024/10: n x n heights, diagonal slopes (so there are trails) with 50% noise (so there are not too many)."""
+    y, x = np.indices((n, n))
+    heights = np.where(rng.random((n, n)) < 0.5, rng.integers(0, 10, (n, n)), (x + y) % 10)
+    return Input((_grid((heights + ord('0')).astype(np.uint8)),))
+
+def stones(n: int, rng: 'np.random.Generator') -> Input:
+    """2024/11: n stones engraved with up to 6 digits."""
+    return Input((_numbers(rng.integers(0, 1_000_000, n)),))
+
+def garden(n: int, rng: 'np.random.Generator') -> Input:
+    """2024/12: n x n plots, regions of 4 x 4 blocks of 26 plants with 5% noise."""
+    coarse = rng.choice(_chars(string.ascii_uppercase), (n // 4 + 1, n // 4 + 1))
+    cells = np.repeat(np.repeat(coarse, 4, axis=0), 4, axis=1)[:n, :n]
+    cells = np.where(rng.random((n, n)) < 0.05, rng.choice(_chars(string.ascii_uppercase), (n, n)), cells)
+    return Input((_grid(cells.astype(np.uint8)),))
+
+def claw_machines(n: int, rng: 'np.random.Generator') -> Input:
+    """2024/13: n claw machines, about half of them winnable."""
+    machines = []
+    for _ in range(n):
+        ax, ay, bx, by = rng.integers(10, 100, 4).tolist()
+        a, b = rng.integers(1, 101, 2).tolist()
+        if rng.random() < 0.5:
+            px, py = a * ax + b * bx, a * ay + b * by
+        else:
+            px, py = rng.integers(1000, 20_000, 2).tolist()
+        machines.append(f"Button A: X+{ax}, Y+{ay}\nButton B: X+{bx}, Y+{by}\nPrize: X={px}, Y={py}")
+    return Input(('\n\n'.join(machines),))
+
+def robots(n: int, rng: 'np.random.Generator') -> Input:
+    """2024/14: n robots on the 101 x 103 bathroom floor."""
+    x, y = rng.integers(0, 101, n).tolist(), rng.integers(0, 103, n).tolist()
+    vx, vy = rng.integers(-99, 100, n).tolist(), rng.integers(-99, 100, n).tolist()
+    return Input(('\n'.join(f"p={x[i]},{y[i]} v={vx[i]},{vy[i]}" for i in range(n)),))
+
+def warehouse(n: int, rng: 'np.random.Generator') -> Input:
+    """2024/15: n x n warehouse with 20% boxes and 5% walls, 10n moves of the robot."""
+    cells = rng.choice(_chars("O#."), (n, n), p=(0.2, 0.05, 0.75))
+    cells[[0, -1], :] = cells[:, [0, -1]] = ord('#')
+    cells[n // 2, n // 2] = ord('@')
+    moves = rng.choice(_chars("<>^v"), 10 * n).tobytes().decode()
+    return Input((_grid(cells), '\n'.join(moves[i:i + 1000] for i in range(0, len(moves), 1000))))
+
+def maze(n: int, rng: 'np.random.Generator') -> Input:
+    """2024/16: n x n maze, a single winding corridor from S to E."""
+    return Input((_grid(_serpentine(n)),))
+
+def falling_bytes(n: int, rng: 'np.random.Generator') -> Input:
+    """2024/18: n x n memory space, 68% of it in the list of bytes, the first 20% of the space fall for Part 1."""
+    cells = rng.permutation(n * n)[:int(0.68 * n * n)]
+    cells = cells[(cells != 0) & (cells != n * n - 1)] # neither start nor exit
+    return Input(('\n'.join(f"{cell % n},{cell // n}" for cell in cells.tolist()),), (n * n // 5, n))
+
+def towels(n: int, rng: 'np.random.Generator') -> Input:
+    """2024/19: 400 towels, n designs, about two thirds of them made of towels."""
+    colors = "wubrg"
+    available = {''.join(rng.choice(list(colors), length)) for length in rng.integers(2, 9, 400).tolist()}
+    available |= set(colors) - {'r'} # like the quest input, one color cannot be matched on its own
+    available = sorted(available)
+    designs = []
+    for _ in range(n):
+        if rng.random() < 2 / 3:
+            design = ''
+            while len(design) < 40:
+                design += available[rng.integers(len(available))]
+        else:
+            design = ''.join(rng.choice(list(colors), rng.integers(40, 61)))
+        designs.append(design)
+    return Input((', '.join(available), '\n'.join(designs)))
+
+def race_track(n: int, rng: 'np.random.Generator') -> Input:
+    """2024/20: n x n race track, a single winding track from S to E."""
+    return Input((_grid(_serpentine(n)),))
+
+def door_codes(n: int, rng: 'np.random.Generator') -> Input:
+    """2024/21: n door codes."""
+    return Input(('\n'.join(f"{code:03d}A" for code in rng.integers(0, 1000, n).tolist()),))
+
+def secrets(n: int, rng: 'np.random.Generator') -> Input:
+    """2024/22: n initial secret numbers of the buyers."""
+    return Input((_numbers(rng.integers(1, 2 ** 24, n), '\n'),))
+
+def lan(n: int, rng: 'np.random.Generator') -> Input:
+    """2024/23: n computers with 13 connections on average, incl. a LAN party of 13."""
+    length = max(2, math.ceil(math.log(n, 26)))
+    ids = rng.choice(26 ** length, n, replace=False)
+    names = [''.join(string.ascii_lowercase[i // 26 ** k % 26] for k in range(length)) for i in ids.tolist()]
+    edges = set()
+    for a, b in zip(rng.integers(0, n, 13 * n // 2).tolist(), rng.integers(0, n, 13 * n // 2).tolist()):
+        if a != b:
+            edges.add((min(a, b), max(a, b)))
+    party = sorted(rng.choice(n, min(n, 13), replace=False).tolist())
+    edges.update((a, b) for i, a in enumerate(party) for b in party[i + 1:])
+    return Input(('\n'.join(f"{names[a]}-{names[b]}" for a, b in edges),))
+
+GENERATORS: dict[tuple[int, int], Callable[[int, 'np.random.Generator'], Input]] = {
+    (2024, 1): location_lists,
+    (2024, 2): reports,
+    (2024, 3): corrupted_memory,
+    (2024, 4): word_search,
+    (2024, 5): print_queue,
+    (2024, 6): lab_map,
+    (2024, 7): calibrations,
+    (2024, 8): antenna_map,
+    (2024, 9): disk_map,
+    (2024, 10): topographic_map,
+    (2024, 11): stones,
+    (2024, 12): garden,
+    (2024, 13): claw_machines,
+    (2024, 14): robots,
+    (2024, 15): warehouse,
+    (2024, 16): maze,
+    # 2024/17 is a fixed program, there is nothing to scale
+    (2024, 18): falling_bytes,
+    (2024, 19): towels,
+    (2024, 20): race_track,
+    (2024, 21): door_codes,
+    (2024, 22): secrets,
+    (2024, 23): lan,
+}
+
+def generate(year: int, day: int, n: int, seed: int = 0) -> Input:
+    if (year, day) not in GENERATORS:
+        raise ValueError(f"There is no input generator for {year}/{day:02d}")
+    return GENERATORS[year, day](n, np.random.default_rng(seed))
+
+def write(year: int, day: int, n: int, seed: int, directory: Path) -> Input:
+    """Generates the input and writes its files to `directory`, under the names the day expects."""
+    generated = generate(year, day, n, seed)
+    for name, content in zip(runner.get_day(year, day).inputs, generated.files, strict=True):
+        path = directory / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return generated
@@ -0,0 +1,152 @@
+"""A 2D character grid stored as a contiguous, padded uint8 NumPy array, shared by the grid based days."""
+from typing import Iterator, NamedTuple
+from aoc import lazy
+
+np = lazy.module("numpy")
+
+FILL = ' ' # character of the padding around the grid
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+    def step(self, dx: int, dy: int, n=1) -> 'Point':
+        return Point(self.x + dx * n, self.y + dy * n)
+
+    def distance(self, other: tuple[int, int]) -> int:
+        """Manhattan distance"""
+        return abs(self.x - other[0]) + abs(self.y - other[1])
+
+# (dx, dy) offsets
+ORTHOGONAL: tuple[tuple[int, int], ...] = ((0, -1), (1, 0), (0, 1), (-1, 0)) # clockwise, starting UP
+DIAGONAL: tuple[tuple[int, int], ...] = ((1, -1), (1, 1), (-1, 1), (-1, -1)) # clockwise, starting UR
+ALL: tuple[tuple[int, int], ...] = ORTHOGONAL + DIAGONAL
+
+def positions(mask: 'np.ndarray') -> list[Point]:
+    """All positions of a boolean [y, x] array which are True, row by row."""
+    return [Point(int(x), int(y)) for y, x in np.argwhere(mask)]
+
+def stencil(rows: list[str]) -> 'np.ndarray':
+    """Pattern to match (see Grid.match) from lines of equal length."""
+    if len({len(row) for row in rows}) != 1:
+        raise ValueError("All lines of a stencil need to have the same, non-zero length!")
+    return np.array([list(row.encode()) for row in rows], dtype=np.uint8)
+
+def variants(pattern: 'np.ndarray', rotations: bool = False, reflections: bool = False) -> list['np.ndarray']:
+    """The pattern, rotated by 90° steps and/or mirrored, without duplicates (e.g. of symmetric patterns)."""
+    found = {}
+    for flipped in (pattern, pattern[:, ::-1]) if reflections else (pattern,):
+        for k in range(4 if rotations else 1):
+            turned = np.rot90(flipped, k)
+            found.setdefault((turned.shape, turned.tobytes()), turned)
+    return list(found.values())
+
+class Grid:
+    """
+    Characters are stored as bytes in `data`, surrounded by `pad` cells of `fill` on each side,
+    so that looking up to `pad` steps beyond the edge needs no bounds checking.
+    `cells` is the unpadded view, indexed [y, x] like the rest of the repo.
+    """
+    def __init__(self, cells: 'np.ndarray', pad: int = 1, fill: str = FILL):
+        self.height, self.width = cells.shape
+        self.pad = pad
+        self.fill = fill
+        self.data = np.full((self.height + 2 * pad, self.width + 2 * pad), ord(fill), dtype=np.uint8)
+        self.cells = self.data[pad:pad + self.height, pad:pad + self.width]
+        self.cells[:] = cells
+
+    @classmethod
+    def from_string(cls, text: str, pad: int = 1, fill: str = FILL) -> 'Grid':
+        """Parses lines of equal length without a Python object per cell."""
+        raw = text.strip().encode()
+        if b'\r' in raw:
+            raw = raw.replace(b'\r', b'')
+        width = raw.find(b'\n')
+        width = len(raw) if width < 0 else width
+        data = np.frombuffer(raw, dtype=np.uint8)
+        height, rest = divmod(len(raw) + 1, width + 1) # the last line has no newline
+        if rest != 0 or np.any(data[width::width + 1] != ord('\n')):
+            raise ValueError("All lines of a grid need to have the same length!")
+        # view the lines without the newlines, the only copy is into the padded array
+        cells = np.lib.stride_tricks.as_strided(data, (height, width), (width + 1, 1), writeable=False)
+        return cls(cells, pad, fill)
+
+    @classmethod
+    def full(cls, width: int, height: int, char: str = '.', pad: int = 1, fill: str = FILL) -> 'Grid':
+        return cls(np.full((height, width), ord(char), dtype=np.uint8), pad, fill)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state['cells'] # a view of data, which pickle would turn into a copy
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self.cells = self.data[self.pad:self.pad + self.height, self.pad:self.pad + self.width]
+
+    def copy(self) -> 'Grid':
+        return Grid(self.cells, self.pad, self.fill)
+
+    def __getitem__(self, pos: tuple[int, int]) -> str:
+        """Returns the character at (x, y), or the fill character for up to `pad` steps off the grid."""
+        x, y = pos
+        return chr(self.data[y + self.pad, x + self.pad])
+
+    def __setitem__(self, pos: tuple[int, int], char: str):
+        x, y = pos
+        if not self.in_bounds(x, y):
+            raise IndexError(f"({x}, {y}) is not on the grid")
+        self.data[y + self.pad, x + self.pad] = ord(char)
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def __str__(self) -> str:
+        return '\n'.join(row.tobytes().decode() for row in self.cells)
+
+    def mask(self, chars: str) -> 'np.ndarray':
+        """Boolean [y, x] array of the cells holding any of the given characters."""
+        return np.isin(self.cells, np.frombuffer(chars.encode(), dtype=np.uint8))
+
+    def find(self, chars: str) -> list[Point]:
+        """All positions holding any of the given characters, row by row."""
+        return positions(self.mask(chars))
+
+    def find_one(self, char: str) -> Point:
+        found = self.find(char)
+        if len(found) != 1:
+            raise ValueError(f"Expected exactly one '{char}' on the grid, found {len(found)}")
+        return found[0]
+
+    def shifted(self, dx: int, dy: int) -> 'np.ndarray':
+        """
+        View of the same shape as `cells` holding the neighbor (dx, dy) of each cell, e.g.
+        `grid.shifted(1, 0) == grid.cells` marks every cell equal to its right neighbor.
+        """
+        if max(abs(dx), abs(dy)) > self.pad:
+            raise ValueError(f"Cannot shift by ({dx}, {dy}) with a padding of {self.pad}")
+        y0, x0 = self.pad + dy, self.pad + dx
+        return self.data[y0:y0 + self.height, x0:x0 + self.width]
+
+    def match(self, pattern: 'np.ndarray', wildcard: str = '.') -> 'np.ndarray':
+        """
+        Boolean [y, x] array of the cells where the pattern (see stencil) matches with its top left corner.
+        Cells of the pattern holding the wildcard match anything. Compares the whole grid at once,
+        one cell of the pattern after the other.
+        """
+        h, w = pattern.shape
+        found = np.zeros((self.height, self.width), dtype=bool)
+        if h > self.height or w > self.width:
+            return found
+        fits = found[:self.height - h + 1, :self.width - w + 1]
+        fits[:] = True
+        for (i, j), char in np.ndenumerate(pattern):
+            if char != ord(wildcard):
+                fits &= self.cells[i:i + fits.shape[0], j:j + fits.shape[1]] == char
+        return found
+
+    def neighbors(self, x: int, y: int, directions: tuple[tuple[int, int], ...] = ORTHOGONAL) -> Iterator[Point]:
+        """Neighbors of (x, y) which are on the grid."""
+        for dx, dy in directions:
+            if self.in_bounds(x + dx, y + dy):
+                yield Point(x + dx, y + dy)
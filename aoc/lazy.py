@@ -0,0 +1,36 @@
+"""
+Modules imported on first use, e.g.
+
+    np = lazy.module("numpy")
+
+at the top of a puzzle module binds `np` right away, but NumPy is only imported (some 40-200 ms) once
+an attribute like `np.array` is looked up. Loading a day thus stays fast, and the functions use `np`
+as if it was imported normally. Annotations must not look it up at import time, i.e. are quoted.
+
+Whatever times a day beyond its import (see aoc.runner) calls load() first, so that the deferred imports
+do not end up in the first phase to use them.
+"""
+import importlib.util
+import sys
+from types import ModuleType
+
+_deferred: list[ModuleType] = [] # the modules returned by module(), loaded or not
+
+def module(name: str) -> ModuleType:
+    """The module `name`, which is imported when one of its attributes is first looked up (if not already)."""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    lazy = importlib.util.module_from_spec(spec)
+    sys.modules[name] = lazy # so `import name` elsewhere gets (and loads) the same module
+    spec.loader.exec_module(lazy)
+    _deferred.append(lazy)
+    return lazy
+
+def load():
+    """Imports all modules deferred by module() so far (if not already)."""
+    for deferred in _deferred:
+        deferred.__name__ # any attribute will do
@@ -0,0 +1,141 @@
+"""Peak memory and the top allocation sites of each phase of a part, via tracemalloc."""
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+ROOT = Path(__file__).resolve().parent.parent
+FRAMES = 3 # frames kept per allocation, enough to get from within re or a numpy wrapper back to the puzzle;
+           # every frame costs time on each allocation (day 10 part 1 solves in 4s, 17s traced with 2, 31s with 4)
+INTERVAL = 0.002 # seconds between two looks at the traced memory while a phase runs
+GROWTH = 1.5 # snapshot again once a phase holds this many times the bytes of the last snapshot
+MIN_GROWTH = 1 << 20 # and at least this many bytes more, as every snapshot copies all traces
+
+# allocations of tracemalloc, this module and its sampling thread (e.g. the snapshots) and anything done while
+# importing a module are no puzzle's fault, wherever these files are among the traced frames
+EXCLUDED = {
+    tracemalloc.__file__,
+    __file__,
+    threading.__file__,
+    "<frozen importlib._bootstrap>",
+    "<frozen importlib._bootstrap_external>",
+    "<unknown>",
+}
+
+@dataclass
+class PhaseMemory:
+    phase: str
+    peak: int      # bytes allocated at the peak of the phase, on top of what was allocated before it
+    retained: int  # bytes still allocated after the phase, on top of what was allocated before it
+    top: list[tuple[str, int]] # "file:line" and bytes it held at the peak of the phase, the largest first
+
+@contextmanager
+def tracing() -> Iterator[None]:
+    """Traces the allocations of the enclosed block (unless they are traced already)."""
+    if tracemalloc.is_tracing():
+        yield
+        return
+    tracemalloc.start(FRAMES)
+    try:
+        yield
+    finally:
+        tracemalloc.stop()
+
+def _site(frames: tuple[tuple[str, int], ...]) -> str | None:
+    """
+    "file:line" (relative to the repo) of the innermost frame of the repo's own code, i.e. a puzzle rather than
+    numpy or re it called. None if there is none among the traced frames, e.g. for allocations of the stdlib
+    while parsing, or if the allocation is excluded (see EXCLUDED).
+    """
+    if any(filename in EXCLUDED for filename, _ in frames):
+        return None
+    for filename, lineno in frames: # from the most recent to the oldest
+        path = Path(filename)
+        if path.is_relative_to(ROOT) and "site-packages" not in path.parts:
+            return f"{path.relative_to(ROOT)}:{lineno}"
+    return None
+
+def _tracebacks(snapshot: tracemalloc.Snapshot) -> Iterator[tuple[tuple[tuple[str, int], ...], int]]:
+    """The frames of each traceback of the snapshot (the most recent first) and the bytes allocated there."""
+    for statistic in snapshot.statistics("traceback"):
+        yield tuple((frame.filename, frame.lineno) for frame in reversed(statistic.traceback)), statistic.size
+
+def _sites(snapshot: tracemalloc.Snapshot) -> dict[str, int]:
+    """Bytes held by each allocation site (see _site) in the snapshot."""
+    sizes: dict[str, int] = {}
+    for frames, size in _tracebacks(snapshot):
+        site = _site(frames)
+        if site is not None:
+            sizes[site] = sizes.get(site, 0) + size
+    return sizes
+
+class _PeakSampler(threading.Thread):
+    """
+    Looks at the traced memory every INTERVAL while a phase runs and takes a snapshot whenever it grew by
+    GROWTH since the last one, so the last snapshot is of about the peak, transient allocations included.
+    Snapshots are not traced themselves, so they don't add to the peak. Only their sites are kept, millions
+    of traces left for the garbage collector to walk would slow down the phase.
+    """
+    def __init__(self, start: int):
+        super().__init__(daemon=True)
+        self.start_size = start
+        self.size = start
+        self.sites: dict[str, int] | None = None
+        self.done = threading.Event()
+
+    def run(self):
+        while not self.done.wait(INTERVAL):
+            self.sample()
+
+    def sample(self):
+        size = tracemalloc.get_traced_memory()[0]
+        grown = size - self.start_size
+        last = self.size - self.start_size
+        if self.sites is None or grown > max(last * GROWTH, last + MIN_GROWTH):
+            self.sites = _sites(tracemalloc.take_snapshot())
+            self.size = size
+
+    def stop(self) -> dict[str, int]:
+        self.done.set()
+        self.join()
+        self.sample() # also catches a phase shorter than the INTERVAL
+        return self.sites
+
+@contextmanager
+def phase(name: str, phases: list[PhaseMemory] | None, top: int = 5) -> Iterator[None]:
+    """
+    Measures the enclosed block as phase `name` and appends it to `phases`, does nothing if that is None.
+    Has to run within `tracing()`.
+
+    The allocation sites are those of the snapshot nearest to the peak (see _PeakSampler) compared to one
+    before the block, so they show what the phase held at its peak, e.g. transient copies as well as the
+    parsed puzzle.
+    """
+    if phases is None:
+        yield
+        return
+    before = _sites(tracemalloc.take_snapshot())
+    tracemalloc.reset_peak()
+    start = tracemalloc.get_traced_memory()[0]
+    sampler = _PeakSampler(start)
+    sampler.start()
+    try:
+        yield
+    finally:
+        at_peak = sampler.stop()
+        size, peak = tracemalloc.get_traced_memory()
+        sites = sorted(((site, held - before.get(site, 0)) for site, held in at_peak.items()), key=lambda site: -site[1])
+        phases.append(PhaseMemory(name, peak - start, size - start, [site for site in sites[:top] if site[1] > 0]))
+
+def format_bytes(size: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GiB"
+
+def format_phase(m: PhaseMemory) -> str:
+    sites = ", ".join(f"{site} {format_bytes(size)}" for site, size in m.top)
+    return f"  {m.phase:6}  peak {format_bytes(m.peak):>9}  retained {format_bytes(m.retained):>9}  {sites}"
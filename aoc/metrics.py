@@ -0,0 +1,112 @@
+"""
+Progress and metrics of the hot loops of the puzzles, e.g.
+
+    for stone in metrics.progress(stones, "Blinking...", unit="blink"):
+
+By default nothing is recorded or shown and `progress` returns the iterable as is, so instrumented
+loops run at full speed. Install a `Recorder` to time the stages and sample the counters
+(and export them as JSON or a Chrome trace), or `Progress` for tqdm bars on the terminal.
+"""
+import json
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, ContextManager, Iterable, Iterator
+
+class Metrics:
+    """The default sink, records nothing and shows nothing."""
+    def progress(self, iterable: Iterable, name: str, unit: str = "it", total: int | None = None) -> Iterable:
+        """Wraps the loop over `iterable` as a stage named `name`, counting its items in `unit`."""
+        return iterable
+
+    def count(self, name: str, n: int = 1):
+        """Adds `n` to the counter `name`. Meant for batches, not for every item of a hot loop."""
+
+    def stage(self, name: str) -> ContextManager:
+        """Times the enclosed block as the stage `name`."""
+        return nullcontext()
+
+class Progress(Metrics):
+    """Shows a tqdm progress bar for every loop, like the puzzles used to."""
+    def progress(self, iterable: Iterable, name: str, unit: str = "it", total: int | None = None) -> Iterable:
+        from tqdm import tqdm # only needed when the bars are actually wanted
+        return tqdm(iterable, desc=name, unit=unit, total=total)
+
+class Recorder(Metrics):
+    """
+    Records the duration of every stage and the counters, sampling the progress of loops
+    every `sample` items (rather than on every item) to keep the hot loops cheap.
+    """
+    def __init__(self, sample: int = 1000):
+        self.sample = sample
+        self.timers: dict[str, float] = defaultdict(float) # seconds, summed over all runs of a stage
+        self.counters: Counter[str] = Counter()
+        self.events: list[dict[str, Any]] = [] # in the Chrome trace event format
+        self._origin = time.perf_counter_ns()
+
+    def _now(self) -> float:
+        """Microseconds since the recorder was created."""
+        return (time.perf_counter_ns() - self._origin) / 1000
+
+    def progress(self, iterable: Iterable, name: str, unit: str = "it", total: int | None = None) -> Iterator:
+        with self.stage(name):
+            n = 0
+            try:
+                for n, item in enumerate(iterable, 1):
+                    if n % self.sample == 0:
+                        self.events.append({"name": name, "ph": "C", "ts": self._now(), "pid": 0, "args": {unit: n}})
+                    yield item
+            finally:
+                self.counters[f"{name} [{unit}]"] += n
+
+    def count(self, name: str, n: int = 1):
+        self.counters[name] += n
+        self.events.append({"name": name, "ph": "C", "ts": self._now(), "pid": 0, "args": {name: self.counters[name]}})
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = self._now()
+        try:
+            yield
+        finally:
+            end = self._now()
+            self.timers[name] += (end - start) / 1e6
+            self.events.append({"name": name, "ph": "X", "ts": start, "dur": end - start, "pid": 0, "tid": 0})
+
+    def to_json(self) -> dict:
+        return {"timers": dict(self.timers), "counters": dict(self.counters)}
+
+    def to_chrome_trace(self) -> dict:
+        """Loadable by chrome://tracing or https://ui.perfetto.dev"""
+        return {"traceEvents": self.events, "displayTimeUnit": "ms"}
+
+    def save(self, path: Path, chrome: bool = False):
+        with open(path, 'w') as file:
+            json.dump(self.to_chrome_trace() if chrome else self.to_json(), file, indent=None if chrome else 2)
+            file.write('\n')
+
+_sink = Metrics()
+
+def install(sink: Metrics) -> Metrics:
+    """Makes `sink` the sink of all instrumented loops and returns the previous one."""
+    global _sink
+    previous, _sink = _sink, sink
+    return previous
+
+@contextmanager
+def use(sink: Metrics) -> Iterator[Metrics]:
+    previous = install(sink)
+    try:
+        yield sink
+    finally:
+        install(previous)
+
+def progress(iterable: Iterable, name: str, unit: str = "it", total: int | None = None) -> Iterable:
+    return _sink.progress(iterable, name, unit, total)
+
+def count(name: str, n: int = 1):
+    _sink.count(name, n)
+
+def stage(name: str) -> ContextManager:
+    return _sink.stage(name)
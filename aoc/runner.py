@@ -0,0 +1,212 @@
+"""Discovers the puzzle module of each day and times its parse, solve and verify phases."""
+import importlib.abc
+import importlib.util
+import os
+import re
+import runpy
+import subprocess
+import sys
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Iterator
+
+from aoc import cache as parse_cache
+from aoc import lazy, memory, metrics
+
+ROOT = Path(__file__).resolve().parent.parent
+CACHE_DIR = ROOT / ".cache" / "parsed"
+SHARED_SOURCES = [ROOT / "aoc" / "grid.py"] # shared code the parsed puzzles are made of
+
+Step = str | Callable[[Any], Any] # method name of the puzzle or a function taking the puzzle
+
+@dataclass
+class Part:
+    """
+    How to solve one part of a day. Defaults follow the dd template.
+
+    If `answer` is None, the return value of `solve` is the answer.
+    """
+    solve: Step | None = "do"
+    answer: Step | None = "checksum"
+    expected: Any = None
+
+@dataclass
+class Day:
+    """Where to find the puzzle module of a day and how to load it (paths are relative to the day's directory)."""
+    module: str = "puzzle"
+    loader: str = "load_puzzle"
+    inputs: tuple[str, ...] = ("input/quest.txt",)
+    load_args: tuple = ()
+    parallel: bool = False # solving borrows the shared workers (aoc.workers), so it is not dispatched to one itself
+    parts: dict[int, Part] = field(default_factory=lambda: {1: Part(), 2: Part(answer="check_p2")})
+
+@dataclass
+class Result:
+    year: int
+    day: int
+    part: int
+    parse: float  # seconds
+    solve: float
+    verify: float
+    answer: Any
+    ok: bool | None # None if there is no known answer to verify against
+    phases: list[memory.PhaseMemory] | None = None # allocations by phase, if traced
+
+def day_dir(year: int, day: int) -> Path:
+    return ROOT / str(year) / f"{day:02d}"
+
+def get_day(year: int, day: int) -> Day:
+    """Returns the registered Day, or the dd template defaults."""
+    from aoc.days import DAYS
+    return DAYS.get((year, day), Day())
+
+def discover(year: int) -> list[int]:
+    """Returns all days of a year which have a puzzle module."""
+    days = []
+    for path in sorted((ROOT / str(year)).iterdir()):
+        if path.is_dir() and path.name.isdigit():
+            day = int(path.name)
+            if (path / f"{get_day(year, day).module}.py").exists():
+                days.append(day)
+    return days
+
+class DayModuleFinder(importlib.abc.MetaPathFinder):
+    """
+    Finds the puzzle modules by their unique names, e.g. `aoc2024_06_map`, so that dataclasses and pickle
+    (also in the worker processes, which did not load the day themselves) can look them up. The day's directory
+    goes on sys.path too, for the modules next to the puzzle which it imports by name (e.g. 2024/01/location_lists).
+    """
+    def find_spec(self, name, path, target=None):
+        match = re.fullmatch(r"aoc(\d{4})_(\d{2})_(\w+)", name)
+        if match is None:
+            return None
+        year, day, module = match.groups()
+        file = day_dir(int(year), int(day)) / f"{module}.py"
+        if not file.exists():
+            return None
+        if str(file.parent) not in sys.path:
+            sys.path.append(str(file.parent))
+        return importlib.util.spec_from_file_location(name, file)
+
+sys.meta_path.append(DayModuleFinder())
+
+def load_module(year: int, day: int) -> ModuleType:
+    """Imports the puzzle module of a day under a unique name (every day has its own `puzzle`)."""
+    return importlib.import_module(f"aoc{year}_{day:02d}_{get_day(year, day).module}")
+
+def run_main(year: int, day: int):
+    """Runs the main.py of a day from its directory, like `python main.py` there, with the aoc package at hand."""
+    directory = day_dir(year, day)
+    sys.path.insert(0, str(directory))
+    os.chdir(directory)
+    runpy.run_path(str(directory / "main.py"), run_name="__main__")
+
+def load_puzzle(year: int, day: int, cache: bool = False, directory: Path | None = None, load_args: tuple | None = None) -> Any:
+    """
+    Loads the quest input of a day.
+
+    Args:
+        cache: Reuse the puzzle parsed by an earlier run, as long as neither the input files
+            nor the source of the day (or the shared code) changed since.
+        directory: Where to find the input files instead of the day's directory, e.g. generated ones.
+        load_args: Instead of the day's `load_args`.
+    """
+    spec = get_day(year, day)
+    module = load_module(year, day)
+    inputs = [(directory or day_dir(year, day)) / input_file for input_file in spec.inputs]
+    load_args = spec.load_args if load_args is None else load_args
+    def parse():
+        return getattr(module, spec.loader)(*map(str, inputs), *load_args)
+    if not cache:
+        return parse()
+
+    sources = [path for path in sorted(day_dir(year, day).glob("*.py")) if path.name != "main.py"] + SHARED_SOURCES
+    key = parse_cache.digest(inputs + sources, spec.loader, load_args, sys.version)
+    return parse_cache.cached(CACHE_DIR / f"{year}_{day:02d}_{key[:16]}.pkl", parse)
+
+def _call(step: Step, puzzle: Any) -> Any:
+    if isinstance(step, str):
+        return getattr(puzzle, step)()
+    return step(puzzle)
+
+def run_part(year: int, day: int, part: int, cache: bool = False, directory: Path | None = None,
+             load_args: tuple | None = None, mem: bool = False) -> Result:
+    """
+    Solves one part of a day on a freshly parsed (or unpickled) puzzle and times each phase.
+    The answer is only verified for the quest input, not for inputs from another `directory`.
+
+    With `mem`, the allocations of each phase are traced as well (see aoc.memory), which slows them down
+    (though the snapshots taken between the phases are not timed).
+    """
+    spec = get_day(year, day).parts[part]
+    load_module(year, day) # not part of the parse phase, nor are the imports it deferred
+    lazy.load()
+
+    name = f"{year}/{day:02d} p{part}"
+    phases = [] if mem else None
+    # the timers run within memory.phase, which snapshots the traced memory before and after each phase
+    with memory.tracing() if mem else nullcontext():
+        with metrics.stage(f"{name} parse"), memory.phase("parse", phases):
+            start = time.perf_counter()
+            puzzle = load_puzzle(year, day, cache, directory, load_args)
+            parse = time.perf_counter() - start
+        with metrics.stage(f"{name} solve"), memory.phase("solve", phases):
+            start = time.perf_counter()
+            answer = _call(spec.solve, puzzle) if spec.solve else None
+            solve = time.perf_counter() - start
+        with metrics.stage(f"{name} verify"), memory.phase("verify", phases):
+            start = time.perf_counter()
+            if spec.answer:
+                answer = _call(spec.answer, puzzle)
+            ok = None if spec.expected is None or directory is not None else answer == spec.expected
+            verify = time.perf_counter() - start
+
+    return Result(year, day, part, parse, solve, verify, answer, ok, phases)
+
+def run(year: int, days: list[int] | None = None, parts: list[int] | None = None, cache: bool = False,
+        mem: bool = False) -> Iterator[Result]:
+    """Runs the selected parts of the selected days (all by default), day by day."""
+    for day in days or discover(year):
+        available = get_day(year, day).parts
+        for part in parts or sorted(available):
+            if part in available:
+                yield run_part(year, day, part, cache, mem=mem)
+
+def import_time(year: int, day: int, repeat: int = 3) -> tuple[float, list[tuple[str, float]]]:
+    """
+    Imports the puzzle module of a day in a fresh interpreter (after the runner itself), best of `repeat`.
+
+    Returns:
+        tuple[float, list[tuple[str, float]]]: The seconds it took and, as reported by `python -X importtime`,
+            the seconds each module imported by it took (incl. its own imports), slowest first.
+    """
+    marker = "-- load_module"
+    code = (f"import sys, time; from aoc import days, runner; print({marker!r}, file=sys.stderr, flush=True); "
+            f"start = time.perf_counter(); runner.load_module({year}, {day}); print(time.perf_counter() - start)")
+    best, modules = float("inf"), []
+    for _ in range(repeat):
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT,
+                              capture_output=True, text=True, check=True)
+        seconds = float(proc.stdout)
+        if seconds < best:
+            best, modules = seconds, []
+            log = proc.stderr.partition(marker)[2]
+            for line in log.splitlines():
+                if line.startswith("import time:") and "|" in line:
+                    _, cumulative, name = line.split("|")
+                    if not name[1:].startswith(" "): # imported by the puzzle module itself, not a nested import
+                        modules.append((name.strip(), int(cumulative) / 1e6))
+    return best, sorted(modules, key=lambda module: -module[1])
+
+def format_seconds(seconds: float) -> str:
+    if seconds < 1:
+        return f"{seconds * 1000:8.2f}ms"
+    return f"{seconds:8.2f}s "
+
+def format_result(r: Result) -> str:
+    status = {True: "ok", False: "FAIL", None: "?"}[r.ok]
+    return (f"{r.year}/{r.day:02d} p{r.part}  parse {format_seconds(r.parse)}  solve {format_seconds(r.solve)}"
+            f"  verify {format_seconds(r.verify)}  {status:4}  {r.answer}")
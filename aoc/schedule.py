@@ -0,0 +1,45 @@
+"""Runs the parts of the days of a year concurrently on the shared worker pool, longest job first."""
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Iterator
+
+from aoc import runner, workers
+
+def estimates(path: Path) -> dict[str, float]:
+    """Median runtime of each part (e.g. "2024/06/2") in a benchmark baseline, empty if there is none."""
+    try:
+        with open(path, 'r') as file:
+            return {key: stats["median"] for key, stats in json.load(file)["results"].items()}
+    except (OSError, ValueError, KeyError):
+        return {}
+
+def run(year: int, days: list[int] | None = None, parts: list[int] | None = None, cache: bool = False,
+        jobs: int | None = None, durations: dict[str, float] | None = None) -> Iterator[runner.Result]:
+    """
+    Runs the selected parts of the selected days (all by default) on a pool of `jobs` workers (one per CPU
+    by default), the longest first according to `durations` (default: the baseline in benchmarks/<year>.json).
+    Parts without an estimate go first, they might be the long ones.
+
+    Days which parallelise internally are solved by this process instead, one at a time,
+    borrowing workers from the same pool for their chunks.
+
+    Yields:
+        Result: of each part, as soon as it is done.
+    """
+    if durations is None:
+        durations = estimates(runner.ROOT / "benchmarks" / f"{year}.json")
+    tasks = []
+    for day in days or runner.discover(year):
+        available = runner.get_day(year, day).parts
+        tasks.extend((day, part) for part in parts or sorted(available) if part in available)
+    tasks.sort(key=lambda task: -durations.get(f"{year}/{task[0]:02d}/{task[1]}", float("inf")))
+
+    pool = workers.start(jobs)
+    with ThreadPoolExecutor(1) as coordinator:
+        futures = []
+        for day, part in tasks:
+            executor = coordinator if runner.get_day(year, day).parallel else pool
+            futures.append(executor.submit(runner.run_part, year, day, part, cache))
+        for future in as_completed(futures):
+            yield future.result()
@@ -0,0 +1,56 @@
+"""
+One warm pool of worker processes, shared by the scheduler (which dispatches whole parts of days to it)
+and by the days which parallelise internally (which borrow its workers for their chunks), so that
+the cores are never oversubscribed and no day pays for starting its own pool.
+"""
+import builtins
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Iterator
+
+_executor: ProcessPoolExecutor | None = None
+_size = 0
+_in_worker = False # set in the worker processes, which must not start a pool of their own
+
+def _init_worker():
+    global _in_worker
+    _in_worker = True
+    import aoc.runner  # noqa: F401 -- registers the DayModuleFinder, so unpickling finds the puzzle modules by their unique names
+
+def start(max_workers: int | None = None) -> ProcessPoolExecutor:
+    """Starts the pool (one worker per CPU by default), unless it is running already."""
+    global _executor, _size
+    if _executor is None:
+        _size = max_workers or os.cpu_count() or 1
+        _executor = ProcessPoolExecutor(_size, initializer=_init_worker)
+    return _executor
+
+def shutdown():
+    global _executor, _size
+    if _executor is not None:
+        _executor.shutdown(cancel_futures=True)
+        _executor = None
+        _size = 0
+
+def size() -> int:
+    """Number of workers to split work between: of the running pool, or the one start() would start."""
+    if _in_worker:
+        return 1
+    return _size or os.cpu_count() or 1
+
+def submit(fn: Callable, *args: Any) -> Future:
+    """Runs fn(*args) on a worker of the pool, or right away within a worker."""
+    if not _in_worker:
+        return start().submit(fn, *args)
+    future = Future()
+    try:
+        future.set_result(fn(*args))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+def map(fn: Callable, iterable: Iterable) -> Iterator:
+    """Like the builtin map (i.e. ordered), but on the workers of the pool, or in place within a worker."""
+    if _in_worker:
+        return builtins.map(fn, iterable)
+    return start().map(fn, iterable)